@@ -0,0 +1,91 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+from .trie import Trie
+
+class AhoCorasick:
+    """
+    An Aho-Corasick automaton compiled from the words in a Trie, which finds
+    every occurrence of every word in a text in a single linear pass.
+
+    States are numbered in level order from the Trie's nodes. Each state
+    keeps the Trie's child transitions plus a failure link to the state for
+    the longest proper suffix of its string that is also in the Trie, which
+    is where matching resumes when no child transition applies.
+    """
+    def __init__(self, trie: Trie):
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [()]
+
+        # The list of nodes doubles as the level order queue, so a state's
+        # failure link always points at a state whose transitions and
+        # outputs are already complete.
+        nodes = [trie.root]
+        prefixes = ['']
+        for state, node in enumerate(nodes):
+            for character, child in node.children.items():
+                new_state = len(nodes)
+                nodes.append(child)
+                prefixes.append(prefixes[state] + character)
+                self.goto[state][character] = new_state
+                self.goto.append({})
+
+                fail = self.fail[state]
+                while fail and character not in self.goto[fail]:
+                    fail = self.fail[fail]
+                fail = self.goto[fail].get(character, 0) if state else 0
+                self.fail.append(fail)
+
+                own = (prefixes[new_state],) if child.is_terminal else ()
+                self.outputs.append(own + self.outputs[fail])
+
+    def find_all(self, text: str | Iterable[str]) -> Iterator[tuple[int, str]]:
+        """
+        Lazily yields a `(start, word)` pair for every occurrence of a word
+        in the given text, in order of where the occurrence ends.
+
+        The text may be a single string or an iterable of string chunks, in
+        which case positions are counted across the whole stream and matches
+        spanning chunk boundaries are still reported.
+        """
+        if isinstance(text, str):
+            text = (text,)
+
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        state = 0
+        end = 0
+
+        for chunk in text:
+            for character in chunk:
+                end += 1
+                while state and character not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(character, 0)
+                for word in outputs[state]:
+                    yield end - len(word), word
+
+    def find_all_batch(self, lines: Iterable[str]) -> list[list[tuple[int, str]]]:
+        """
+        Returns the `(start, word)` matches for each of the given lines,
+        matching every line within one call rather than one call per line.
+        """
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        results = []
+
+        for line in lines:
+            matches = []
+            state = 0
+            for end, character in enumerate(line, 1):
+                while state and character not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(character, 0)
+                if outputs[state]:
+                    for word in outputs[state]:
+                        matches.append((end - len(word), word))
+            results.append(matches)
+
+        return results
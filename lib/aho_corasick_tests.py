@@ -0,0 +1,42 @@
+from .aho_corasick import AhoCorasick
+from .trie import Trie
+import random
+import unittest
+
+def _build(words):
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    return AhoCorasick(trie)
+
+def _brute_force(words, text):
+    return sorted((start, word) for word in set(words)
+        for start in range(len(text) - len(word) + 1) if text.startswith(word, start))
+
+class TestAhoCorasick(unittest.TestCase):
+    def test_find_all(self):
+        automaton = _build(['he', 'she', 'his', 'hers'])
+        self.assertListEqual(
+            [(1, 'she'), (2, 'he'), (2, 'hers')],
+            list(automaton.find_all('ushers')))
+        self.assertListEqual([], list(automaton.find_all('xyz')))
+
+    def test_find_all_chunks(self):
+        automaton = _build(['hello', 'world', 'owo'])
+        chunks = ['hel', 'lowo', 'r', 'ld']
+        self.assertListEqual(
+            [(0, 'hello'), (4, 'owo'), (5, 'world')],
+            sorted(automaton.find_all(iter(chunks))))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        words = [''.join(rng.choices('abc', k=rng.randint(1, 4))) for _ in range(30)]
+        automaton = _build(words)
+        lines = [''.join(rng.choices('abcd', k=rng.randint(0, 40))) for _ in range(50)]
+        batched = automaton.find_all_batch(lines)
+        for line, matches in zip(lines, batched):
+            self.assertListEqual(_brute_force(words, line), sorted(automaton.find_all(line)))
+            self.assertListEqual(_brute_force(words, line), sorted(matches))
+
+if __name__ == '__main__':
+    unittest.main()
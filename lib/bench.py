@@ -0,0 +1,836 @@
+"""
+Benchmarks for the data structures and algorithms in this package.
+
+Run them with `python -m lib.bench`, which prints the results as JSON. Pass
+`--output` to save the results and `--compare` to check a run against saved
+results, in which case the exit status is 1 if anything got slower by more
+than the threshold.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction as StdlibFraction
+from typing import Callable
+from .aho_corasick import AhoCorasick
+from .compact_trie import CompactTrie
+from .concurrent_trie import SnapshotTrie
+from .fraction import Fraction
+from .fraction_array import FractionArray
+from .greedy import (activity_selection, activity_selection_brute, activity_selection_exact,
+    activity_selection_greedy, activity_selection_stream, activity_selection_stream_async,
+    egyptian_fractions, egyptian_fractions_batch, job_sequencing, job_sequencing_problem_greedy,
+    weighted_activity_selection)
+from .radix_trie import RadixTrie
+from .sharded_trie import ShardedTrie
+from .trie import Trie, shortest_unique_prefix
+from .trie_cache import CachedTrie
+from .trie_service import TrieService
+from .trie_stats import instrument
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+# Sizes for benchmarks on keys over a thousand characters long.
+LONG_SIZES = (10, 100, 500)
+
+class Benchmark:
+    def __init__(self, name: str, setup: Callable[[int], Callable[[], object]], sizes: tuple[int, ...], max_size: int | None):
+        self.name = name
+        self.setup = setup
+        self.sizes = sizes
+        self.max_size = max_size
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+def benchmark(name: str, sizes: tuple[int, ...] = DEFAULT_SIZES, max_size: int | None = None):
+    """
+    Registers a benchmark. The decorated function takes a dataset size,
+    prepares its data, and returns the function to be timed. Sizes above
+    `max_size` are skipped, even when requested explicitly.
+    """
+    def register(setup: Callable[[int], Callable[[], object]]):
+        BENCHMARKS[name] = Benchmark(name, setup, sizes, max_size)
+        return setup
+    return register
+
+def run(names: list[str] | None = None, sizes: list[int] | None = None, repeat: int = 5) -> list[dict]:
+    """
+    Runs the benchmarks with the given names, or all of them, at the given
+    sizes, or each benchmark's default sizes. Every benchmark is timed
+    `repeat` times per size, and the fastest time is reported. Benchmarks
+    that return a dict of further measurements, such as latencies, have
+    those from the fastest run added to their results.
+    """
+    results = []
+    for name in names or BENCHMARKS:
+        bench = BENCHMARKS[name]
+        for size in sizes or bench.sizes:
+            if bench.max_size is not None and size > bench.max_size:
+                continue
+
+            function = bench.setup(size)
+            timings = []
+            measurements = {}
+            for _ in range(repeat):
+                began = time.perf_counter()
+                value = function()
+                elapsed = time.perf_counter() - began
+                if not timings or elapsed < min(timings):
+                    measurements = value if isinstance(value, dict) else {}
+                timings.append(elapsed)
+
+            results.append({
+                **measurements,
+                'name': name,
+                'size': size,
+                'seconds': min(timings),
+                'mean_seconds': sum(timings) / len(timings),
+            })
+
+    return results
+
+def compare(results: list[dict], baseline: list[dict], threshold: float = 0.1) -> list[dict]:
+    """
+    Returns the results that are slower than the matching baseline result
+    by more than the given fraction, along with the baseline time and the
+    ratio between them. Results with no baseline are ignored.
+    """
+    baseline_seconds = {(result['name'], result['size']): result['seconds'] for result in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_seconds.get((result['name'], result['size']))
+        if previous and result['seconds'] > previous * (1 + threshold):
+            regressions.append(dict(result, baseline_seconds=previous, ratio=result['seconds'] / previous))
+
+    return regressions
+
+def _words(size: int, seed: int = 0) -> list[str]:
+    """Returns random lowercase words of 3 to 12 characters."""
+    rng = random.Random(seed)
+    return [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12))) for _ in range(size)]
+
+def _paths(size: int, seed: int = 0) -> list[str]:
+    """Returns random file-path-like keys that share long prefixes."""
+    rng = random.Random(seed)
+    return [f'/srv/{rng.choice(["www", "api", "static"])}/{rng.choice(["assets", "users", "reports"])}/{rng.randrange(size)}/index.html'
+        for _ in range(size)]
+
+def _long_words(size: int, seed: int = 0) -> list[str]:
+    """Returns random words of 1000 to 1500 characters drawn from a small alphabet."""
+    rng = random.Random(seed)
+    return [''.join(rng.choices('acgt', k=rng.randint(1000, 1500))) for _ in range(size)]
+
+def _zipf_queries(size: int, seed: int = 0) -> tuple[list[str], list[str]]:
+    """
+    Returns a vocabulary of random file-path-like keys, and `size` queries
+    drawn from it with Zipf-distributed frequencies, so a few keys make up
+    most of the queries.
+    """
+    rng = random.Random(seed)
+    vocabulary = _paths(size, seed)
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    return vocabulary, rng.choices(vocabulary, weights, k=size)
+
+def _intervals(size: int, seed: int = 0) -> tuple[list[int], list[int]]:
+    """Returns random start and finish times, in no particular order."""
+    rng = random.Random(seed)
+    start = [rng.randrange(size * 10) for _ in range(size)]
+    finish = [s + rng.randrange(1, 50) for s in start]
+    return start, finish
+
+def _fractions(size: int, seed: int = 0) -> list[Fraction]:
+    """Returns random positive Fractions with terms below 10000."""
+    rng = random.Random(seed)
+    return [Fraction(rng.randint(1, 9999), rng.randint(1, 9999)) for _ in range(size)]
+
+def _stdlib_fractions(size: int, seed: int = 0) -> list[StdlibFraction]:
+    """Returns the same values as `_fractions`, as `fractions.Fraction` instances to compare against."""
+    return [StdlibFraction(fraction.numerator, fraction.denominator) for fraction in _fractions(size, seed)]
+
+def _proper_fractions(size: int, seed: int = 0) -> list[Fraction]:
+    """Returns random Fractions between zero and one, with denominators below 1000."""
+    rng = random.Random(seed)
+    fractions = []
+    for _ in range(size):
+        denominator = rng.randint(2, 999)
+        fractions.append(Fraction(rng.randint(1, denominator - 1), denominator))
+    return fractions
+
+# Holds the files written by benchmarks, and is removed when the process exits.
+_temporary_directory = None
+
+def _temporary_path(name: str) -> str:
+    """Returns a path for the given file name in a temporary directory."""
+    global _temporary_directory
+    if _temporary_directory is None:
+        _temporary_directory = tempfile.TemporaryDirectory()
+    return os.path.join(_temporary_directory.name, name)
+
+def _trie(words: list[str]) -> Trie:
+    """Returns a Trie holding the given words."""
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+@benchmark('trie.insert')
+def _trie_insert(size):
+    words = _words(size)
+    return lambda: _trie(words)
+
+@benchmark('trie.bulk_insert')
+def _trie_bulk_insert(size):
+    words = sorted(_words(size))
+    return lambda: Trie.from_sorted(words)
+
+@benchmark('trie.search')
+def _trie_search(size):
+    words = _words(size)
+    trie = _trie(words)
+    return lambda: [trie.search(word) for word in words]
+
+@benchmark('trie.delete')
+def _trie_delete(size):
+    words = _words(size)
+    def delete():
+        trie = _trie(words)
+        for word in words:
+            trie.delete(word)
+    return delete
+
+@benchmark('trie.longest_prefix')
+def _trie_longest_prefix(size):
+    words = _words(size)
+    trie = _trie(words[:size // 2])
+    return lambda: [trie.longest_prefix(word) for word in words]
+
+@benchmark('trie.shortest_unique_prefix')
+def _trie_shortest_unique_prefix(size):
+    trie = _trie(_words(size))
+    return lambda: shortest_unique_prefix(trie)
+
+@benchmark('trie.iter_prefix')
+def _trie_iter_prefix(size):
+    trie = _trie(_words(size))
+    return lambda: [list(trie.iter_prefix(character, limit=10)) for character in string.ascii_lowercase]
+
+@benchmark('trie.top_k')
+def _trie_top_k(size):
+    trie = _trie(_words(size))
+    return lambda: [trie.top_k(character, 10) for character in string.ascii_lowercase]
+
+@benchmark('trie.top_k_after_writes')
+def _trie_top_k_after_writes(size):
+    trie = _trie(_words(size))
+    trie.top_k('', 10)
+    extra = [word for word in _words(200, seed=1) if not trie.search(word)][:100]
+    def top_k():
+        # Each new word is deleted again, so every run sees the same Trie.
+        for word in extra:
+            trie.insert(word)
+            trie.top_k('', 10)
+            trie.delete(word)
+            trie.top_k('', 10)
+    return top_k
+
+def _levenshtein(a: str, b: str) -> int:
+    """Returns the edit distance between two strings."""
+    row = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j, y in enumerate(b, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (x != y))
+    return row[-1]
+
+def _search_fuzzy_brute(words: list[str], word: str, max_distance: int) -> list[tuple[str, int]]:
+    """Returns the same results as `Trie.search_fuzzy` by measuring the distance to every word."""
+    distances = ((candidate, _levenshtein(word, candidate)) for candidate in words)
+    return sorted(
+        ((candidate, distance) for candidate, distance in distances if distance <= max_distance),
+        key=lambda result: (result[1], result[0]))
+
+def _fuzzy_benchmarks(max_distance: int, suffix: str):
+    """Registers the fuzzy search benchmarks for the given maximum distance."""
+    @benchmark(f'trie.search_fuzzy{suffix}', sizes=(1000, 10000))
+    def search_fuzzy(size):
+        words = _words(size)
+        trie = _trie(words)
+        return lambda: [trie.search_fuzzy(word, max_distance) for word in words[:20]]
+
+    @benchmark(f'trie.search_fuzzy{suffix}_brute', sizes=(1000, 10000))
+    def search_fuzzy_brute(size):
+        words = sorted(set(_words(size)))
+        queries = _words(size)[:20]
+        return lambda: [_search_fuzzy_brute(words, word, max_distance) for word in queries]
+
+_fuzzy_benchmarks(1, '')
+_fuzzy_benchmarks(2, '_2')
+
+@benchmark('trie.insert_long', sizes=LONG_SIZES)
+def _trie_insert_long(size):
+    words = _long_words(size)
+    return lambda: _trie(words)
+
+@benchmark('trie.search_long', sizes=LONG_SIZES)
+def _trie_search_long(size):
+    words = _long_words(size)
+    trie = _trie(words)
+    return lambda: [trie.search(word) for word in words]
+
+@benchmark('trie.delete_long', sizes=LONG_SIZES)
+def _trie_delete_long(size):
+    words = _long_words(size)
+    def delete():
+        trie = _trie(words)
+        for word in words:
+            trie.delete(word)
+    return delete
+
+@benchmark('trie.longest_prefix_long', sizes=LONG_SIZES)
+def _trie_longest_prefix_long(size):
+    words = _long_words(size)
+    trie = _trie(words)
+    return lambda: [trie.longest_prefix(word + word) for word in words]
+
+@benchmark('trie.shortest_unique_prefix_long', sizes=LONG_SIZES)
+def _trie_shortest_unique_prefix_long(size):
+    words = _long_words(size)
+    # A shared stem puts every unique prefix over a thousand nodes deep.
+    trie = _trie([words[0] + word for word in words])
+    return lambda: shortest_unique_prefix(trie)
+
+@benchmark('trie_stats.search')
+def _trie_stats_search(size):
+    words = _words(size)
+    trie = _trie(words)
+    instrument(trie)
+    return lambda: [trie.search(word) for word in words]
+
+@benchmark('trie_stats.detached_search')
+def _trie_stats_detached_search(size):
+    words = _words(size)
+    trie = _trie(words)
+    instrument(trie).detach()
+    return lambda: [trie.search(word) for word in words]
+
+def _serve(trie: Trie, queries: list[str], concurrency: int = 64, threaded: bool = False, **options) -> dict:
+    """
+    Runs a load generator against a TrieService over the Trie, with
+    `concurrency` clients each sending their share of the queries one after
+    another. Returns the median and 99th percentile latency in milliseconds
+    and the number of queries answered per second.
+    """
+    async def client(service: TrieService, words: list[str], latencies: list[float]):
+        for word in words:
+            began = time.perf_counter()
+            await service.search(word)
+            latencies.append(time.perf_counter() - began)
+
+    async def load(executor: ThreadPoolExecutor | None) -> dict:
+        latencies = []
+        began = time.perf_counter()
+        async with TrieService(trie, executor=executor, **options) as service:
+            await asyncio.gather(*(client(service, queries[i::concurrency], latencies) for i in range(concurrency)))
+        elapsed = time.perf_counter() - began
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+        return {
+            'p50_ms': percentiles[49] * 1000,
+            'p99_ms': percentiles[98] * 1000,
+            'queries_per_second': len(queries) / elapsed,
+        }
+
+    if not threaded:
+        return asyncio.run(load(None))
+    with ThreadPoolExecutor(1) as executor:
+        return asyncio.run(load(executor))
+
+@benchmark('trie_service.search', sizes=(1000, 10000))
+def _trie_service_search(size):
+    words = _words(size)
+    trie = _trie(words)
+    return lambda: _serve(trie, words)
+
+@benchmark('trie_service.search_threaded', sizes=(1000, 10000))
+def _trie_service_search_threaded(size):
+    words = _words(size)
+    trie = _trie(words)
+    return lambda: _serve(trie, words, threaded=True)
+
+@benchmark('trie_service.search_processes', sizes=(1000, 10000))
+def _trie_service_search_processes(size):
+    words = _words(size)
+    trie = _trie(words)
+    return lambda: _serve(trie, words, processes=1)
+
+@benchmark('trie_service.search_threaded_unbatched', sizes=(1000, 10000))
+def _trie_service_search_threaded_unbatched(size):
+    words = _words(size)
+    trie = _trie(words)
+    return lambda: _serve(trie, words, threaded=True, max_batch=1)
+
+@benchmark('trie_service.search_unbatched', sizes=(1000, 10000))
+def _trie_service_search_unbatched(size):
+    words = _words(size)
+    trie = _trie(words)
+    return lambda: _serve(trie, words, max_batch=1)
+
+def _read_while_writing(trie: Trie, queries: list[str], writes: list[str], readers: int = 4,
+        lock: threading.Lock | None = None) -> dict:
+    """
+    Runs `readers` threads that each look up every query while another
+    thread keeps inserting and then deleting the `writes`, so the Trie ends
+    up as it started. Reads and writes take the lock, if one is given.
+    Returns the lookups and writes made per second.
+    """
+    done = threading.Event()
+    writes_made = 0
+
+    def read():
+        if lock is None:
+            for query in queries:
+                trie.search(query)
+        else:
+            for query in queries:
+                with lock:
+                    trie.search(query)
+
+    def write():
+        nonlocal writes_made
+        while not done.is_set():
+            for operation in (trie.insert, trie.delete):
+                for word in writes:
+                    if lock is None:
+                        operation(word)
+                    else:
+                        with lock:
+                            operation(word)
+                writes_made += len(writes)
+
+    writer = threading.Thread(target=write)
+    threads = [threading.Thread(target=read) for _ in range(readers)]
+    began = time.perf_counter()
+    writer.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    done.set()
+    writer.join()
+    return {
+        'lookups_per_second': readers * len(queries) / elapsed,
+        'writes_per_second': writes_made / elapsed,
+    }
+
+def _concurrent_writes(size: int) -> tuple[list[str], list[str]]:
+    """Returns the words to look up, and new words for the writer to insert and delete."""
+    words = _words(size)
+    present = set(words)
+    return words, [word for word in _words(200, seed=1) if word not in present][:100]
+
+@benchmark('snapshot_trie.search_concurrent', sizes=(1000, 10000))
+def _snapshot_trie_search_concurrent(size):
+    words, writes = _concurrent_writes(size)
+    trie = SnapshotTrie()
+    trie.bulk_insert(words)
+    return lambda: _read_while_writing(trie, words, writes)
+
+@benchmark('trie.search_concurrent_locked', sizes=(1000, 10000))
+def _trie_search_concurrent_locked(size):
+    words, writes = _concurrent_writes(size)
+    trie = _trie(words)
+    return lambda: _read_while_writing(trie, words, writes, lock=threading.Lock())
+
+@benchmark('trie.search_zipf')
+def _trie_search_zipf(size):
+    vocabulary, queries = _zipf_queries(size)
+    trie = _trie(vocabulary)
+    return lambda: [(trie.search(query), trie.longest_prefix(query)) for query in queries]
+
+@benchmark('trie_cache.search_zipf')
+def _trie_cache_search_zipf(size):
+    vocabulary, queries = _zipf_queries(size)
+    trie = _trie(vocabulary)
+    def search():
+        cache = CachedTrie(trie)
+        for query in queries:
+            cache.search(query)
+            cache.longest_prefix(query)
+        return cache.stats()
+    return search
+
+@benchmark('trie.mixed_zipf')
+def _trie_mixed_zipf(size):
+    vocabulary, queries = _zipf_queries(size)
+    def mixed():
+        # The inserts change the Trie, so each run builds its own.
+        trie = _trie(vocabulary[::2])
+        for idx, query in enumerate(queries):
+            if idx % 100 == 0:
+                trie.insert(query)
+            trie.search(query)
+            trie.longest_prefix(query)
+    return mixed
+
+@benchmark('trie_cache.mixed_zipf')
+def _trie_cache_mixed_zipf(size):
+    vocabulary, queries = _zipf_queries(size)
+    def mixed():
+        # The inserts change the Trie, so each run builds its own.
+        cache = CachedTrie(_trie(vocabulary[::2]))
+        for idx, query in enumerate(queries):
+            if idx % 100 == 0:
+                cache.insert(query)
+            cache.search(query)
+            cache.longest_prefix(query)
+        return cache.stats()
+    return mixed
+
+@benchmark('compact_trie.from_words')
+def _compact_trie_from_words(size):
+    words = _words(size)
+    return lambda: CompactTrie.from_words(words)
+
+@benchmark('compact_trie.search')
+def _compact_trie_search(size):
+    words = _words(size)
+    trie = CompactTrie.from_words(words)
+    return lambda: [trie.search(word) for word in words]
+
+@benchmark('compact_trie.save')
+def _compact_trie_save(size):
+    trie = CompactTrie.from_words(_words(size))
+    path = _temporary_path(f'save.{size}.bin')
+    return lambda: trie.save(path)
+
+@benchmark('compact_trie.load')
+def _compact_trie_load(size):
+    words = _words(size)
+    path = _temporary_path(f'load.{size}.bin')
+    CompactTrie.from_words(words).save(path)
+    def load():
+        with CompactTrie.load(path) as trie:
+            return [trie.search(word) for word in words[:100]]
+    return load
+
+# Run in a fresh interpreter by `_process_rss`, with the package's parent
+# directory as the working directory. It builds or loads a Trie, looks up
+# every word, and prints the peak RSS in kilobytes before and after. On
+# Linux, `ru_maxrss` starts out at the parent's RSS when it forked, so the
+# process's own peak is read from /proc where it can be.
+_RSS_SCRIPT = """
+import resource
+import sys
+from {package}.compact_trie import CompactTrie
+from {package}.trie import Trie
+
+def peak_rss():
+    try:
+        with open('/proc/self/status') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+mode, words_path, trie_path = sys.argv[1:]
+with open(words_path) as file:
+    words = file.read().split()
+before = peak_rss()
+if mode == 'trie':
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+elif mode == 'compact_trie':
+    trie = CompactTrie.from_words(words)
+else:
+    trie = CompactTrie.load(trie_path)
+assert all(trie.search(word) for word in words)
+print(before, peak_rss())
+"""
+
+def _process_rss(mode: str, words_path: str, trie_path: str) -> dict:
+    """
+    Starts a new process that builds or loads a Trie in the given mode and
+    queries it, and returns its peak RSS in kilobytes, along with how much
+    of that the Trie added. The time taken includes starting the process.
+    """
+    package = __package__
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, '-c', _RSS_SCRIPT.format(package=package), mode, words_path, trie_path],
+        cwd=root, check=True, capture_output=True, text=True).stdout
+    before, after = map(int, output.split())
+    return {'max_rss_kb': after, 'trie_rss_kb': after - before}
+
+def _rss_benchmark(mode: str):
+    """Registers a benchmark of the memory used by a process holding a Trie built or loaded in the given mode."""
+    @benchmark(f'{mode}.process_rss', sizes=(10000, 100000))
+    def process_rss(size):
+        words = _words(size)
+        words_path = _temporary_path(f'words.{size}.txt')
+        trie_path = _temporary_path(f'rss.{size}.bin')
+        with open(words_path, 'w') as file:
+            file.write('\n'.join(words))
+        CompactTrie.from_words(words).save(trie_path)
+        return lambda: _process_rss(mode, words_path, trie_path)
+
+for _mode in ('trie', 'compact_trie', 'compact_trie.load'):
+    _rss_benchmark(_mode)
+
+def _sharded_trie_benchmarks(shards: int):
+    """Registers the ShardedTrie benchmarks for the given number of shards."""
+    @benchmark(f'sharded_trie.insert_batch.{shards}')
+    def insert_batch(size):
+        words = _words(size)
+        def insert():
+            with ShardedTrie(shards) as trie:
+                trie.insert_batch(words)
+        return insert
+
+    @benchmark(f'sharded_trie.search_batch.{shards}')
+    def search_batch(size):
+        words = _words(size)
+        trie = ShardedTrie(shards)
+        trie.insert_batch(words)
+        return lambda: trie.search_batch(words)
+
+for _shards in (1, 2, 4):
+    _sharded_trie_benchmarks(_shards)
+
+@benchmark('radix_trie.search')
+def _radix_trie_search(size):
+    paths = _paths(size)
+    trie = RadixTrie()
+    for path in paths:
+        trie.insert(path)
+    return lambda: [trie.search(path) for path in paths]
+
+@benchmark('trie.search_paths')
+def _trie_search_paths(size):
+    paths = _paths(size)
+    trie = _trie(paths)
+    return lambda: [trie.search(path) for path in paths]
+
+@benchmark('aho_corasick.find_all_batch')
+def _aho_corasick_find_all_batch(size):
+    automaton = AhoCorasick(_trie(_words(size)))
+    lines = [' '.join(_words(20, seed)) for seed in range(100)]
+    return lambda: automaton.find_all_batch(lines)
+
+@benchmark('greedy.activity_selection_brute', sizes=(4, 6, 8), max_size=8)
+def _activity_selection_brute(size):
+    start, finish = _intervals(size)
+    return lambda: activity_selection_brute(start, finish)
+
+@benchmark('greedy.activity_selection_exact', sizes=(8, 16, 32), max_size=40)
+def _activity_selection_exact(size):
+    start, finish = _intervals(size)
+    return lambda: activity_selection_exact(start, finish)
+
+@benchmark('greedy.activity_selection_greedy')
+def _activity_selection_greedy(size):
+    start, finish = _intervals(size)
+    order = sorted(range(size), key=finish.__getitem__)
+    start = [start[i] for i in order]
+    finish = [finish[i] for i in order]
+    return lambda: activity_selection_greedy(start, finish)
+
+@benchmark('greedy.activity_selection')
+def _activity_selection(size):
+    start, finish = _intervals(size)
+    return lambda: activity_selection(start, finish)
+
+@benchmark('greedy.weighted_activity_selection')
+def _weighted_activity_selection(size):
+    start, finish = _intervals(size)
+    weight = [i % 7 + 1 for i in range(size)]
+    return lambda: weighted_activity_selection(start, finish, weight)
+
+@benchmark('greedy.activity_selection_stream')
+def _activity_selection_stream(size):
+    start, finish = _intervals(size)
+    pairs = sorted(zip(start, finish), key=lambda pair: pair[1])
+    return lambda: list(activity_selection_stream(pairs, window=8))
+
+@benchmark('greedy.activity_selection_stream_async')
+def _activity_selection_stream_async(size):
+    start, finish = _intervals(size)
+    pairs = sorted(zip(start, finish), key=lambda pair: pair[1])
+
+    async def stream():
+        for pair in pairs:
+            yield pair
+
+    async def collect():
+        return [i async for i in activity_selection_stream_async(stream())]
+
+    return lambda: asyncio.run(collect())
+
+@benchmark('greedy.egyptian_fractions')
+def _egyptian_fractions(size):
+    fractions = _proper_fractions(size)
+    return lambda: [egyptian_fractions(fraction) for fraction in fractions]
+
+@benchmark('greedy.egyptian_fractions_binary')
+def _egyptian_fractions_binary(size):
+    fractions = _proper_fractions(size)
+    return lambda: [egyptian_fractions(fraction, 'binary') for fraction in fractions]
+
+@benchmark('greedy.egyptian_fractions_golomb')
+def _egyptian_fractions_golomb(size):
+    fractions = _proper_fractions(size)
+    return lambda: [egyptian_fractions(fraction, 'golomb') for fraction in fractions]
+
+@benchmark('greedy.egyptian_fractions_batch')
+def _egyptian_fractions_batch(size):
+    fractions = _proper_fractions(size)
+    return lambda: egyptian_fractions_batch(fractions)
+
+@benchmark('greedy.egyptian_fractions_repeated')
+def _egyptian_fractions_repeated(size):
+    # Every value appears ten times, as in a batch of recurring inputs.
+    fractions = _proper_fractions(size // 10) * 10
+    return lambda: [egyptian_fractions(fraction) for fraction in fractions]
+
+@benchmark('greedy.egyptian_fractions_batch_repeated')
+def _egyptian_fractions_batch_repeated(size):
+    fractions = _proper_fractions(size // 10) * 10
+    return lambda: egyptian_fractions_batch(fractions)
+
+@benchmark('greedy.job_sequencing_problem_greedy')
+def _job_sequencing_problem_greedy(size):
+    rng = random.Random(0)
+    jobs = [(str(i), rng.randint(1, size), rng.randint(1, 1000)) for i in range(size)]
+    return lambda: job_sequencing_problem_greedy(jobs)
+
+def _job_sequencing_backward_scan(jobs: list[tuple[str, int, int]]) -> list[str]:
+    """
+    The previous `job_sequencing_problem_greedy`, kept as a reference: it
+    scans backwards from each job's deadline for a free slot, which takes
+    quadratic time once the early slots fill up.
+    """
+    n = max(jobs, key=lambda job: job[1])[1] + 1
+    sorted_jobs = list(reversed(sorted(jobs, key=lambda job: job[2])))
+    slots = ['' for _ in range(n)]
+
+    for job in sorted_jobs:
+        for j in range(job[1], 0, -1):
+            if not slots[j]:
+                slots[j] = job[0]
+                break
+
+    return list(filter(lambda slot: slot != '', slots))
+
+@benchmark('greedy.job_sequencing_backward_scan')
+def _job_sequencing_backward_scan_benchmark(size):
+    rng = random.Random(0)
+    jobs = [(str(i), rng.randint(1, size), rng.randint(1, 1000)) for i in range(size)]
+    return lambda: _job_sequencing_backward_scan(jobs)
+
+def _shared_deadline_jobs(size: int, seed: int = 0) -> list[tuple[str, int, int]]:
+    """Returns jobs that all share the latest deadline, the worst case for the backward scan."""
+    rng = random.Random(seed)
+    return [(str(i), size, rng.randint(1, 1000)) for i in range(size)]
+
+@benchmark('greedy.job_sequencing_shared_deadline')
+def _job_sequencing_shared_deadline(size):
+    jobs = _shared_deadline_jobs(size)
+    return lambda: job_sequencing_problem_greedy(jobs)
+
+@benchmark('greedy.job_sequencing_backward_scan_shared_deadline', max_size=10000)
+def _job_sequencing_backward_scan_shared_deadline(size):
+    jobs = _shared_deadline_jobs(size)
+    return lambda: _job_sequencing_backward_scan(jobs)
+
+@benchmark('greedy.job_sequencing')
+def _job_sequencing(size):
+    rng = random.Random(0)
+    jobs = [(str(i), rng.randint(1, 10 ** 9), rng.randint(1, 1000)) for i in range(size)]
+    return lambda: job_sequencing(jobs)
+
+@benchmark('fraction.arithmetic')
+def _fraction_arithmetic(size):
+    fractions = _fractions(size)
+    def arithmetic():
+        for a, b in zip(fractions, fractions[1:]):
+            (a + b) * (a - b) / b
+    return arithmetic
+
+@benchmark('fraction.arithmetic_stdlib')
+def _fraction_arithmetic_stdlib(size):
+    fractions = _stdlib_fractions(size)
+    def arithmetic():
+        for a, b in zip(fractions, fractions[1:]):
+            (a + b) * (a - b) / b
+    return arithmetic
+
+@benchmark('fraction.compare')
+def _fraction_compare(size):
+    fractions = _fractions(size)
+    return lambda: sorted(fractions)
+
+@benchmark('fraction.compare_stdlib')
+def _fraction_compare_stdlib(size):
+    fractions = _stdlib_fractions(size)
+    return lambda: sorted(fractions)
+
+@benchmark('fraction_array.arithmetic')
+def _fraction_array_arithmetic(size):
+    fractions = _fractions(size)
+    a = FractionArray.from_fractions(fractions)
+    b = FractionArray.from_fractions(fractions[1:] + fractions[:1])
+    return lambda: (a + b) * (a - b) / b
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m lib.bench', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('names', nargs='*', help='benchmarks to run, or prefixes such as "trie." (default: all)')
+    parser.add_argument('--sizes', help='comma separated dataset sizes (default: per benchmark)')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per benchmark and size (default: 5)')
+    parser.add_argument('--output', help='file to write the JSON results to, instead of stdout')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON results to check for regressions against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown allowed by --compare (default: 0.1)')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    names = [name for name in BENCHMARKS if not args.names or any(name.startswith(prefix) for prefix in args.names)]
+    if not names:
+        parser.error('no benchmarks match ' + ', '.join(args.names))
+    sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else None
+
+    results = run(names, sizes, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression["name"]} size={regression["size"]}: '
+                f'{regression["seconds"]:.6f}s vs {regression["baseline_seconds"]:.6f}s '
+                f'({regression["ratio"]:.2f}x)', file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
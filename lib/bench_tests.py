@@ -0,0 +1,53 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from . import bench
+
+class TestBench(unittest.TestCase):
+    def test_run(self):
+        results = bench.run(['trie.insert', 'greedy.activity_selection_brute'], [5, 10], repeat=2)
+        self.assertListEqual(
+            [('trie.insert', 5), ('trie.insert', 10), ('greedy.activity_selection_brute', 5)],
+            [(result['name'], result['size']) for result in results])
+        for result in results:
+            self.assertGreaterEqual(result['mean_seconds'], result['seconds'])
+
+    def test_every_benchmark_runs(self):
+        for result in bench.run(sizes=[8], repeat=1):
+            self.assertGreaterEqual(result['seconds'], 0)
+
+    def test_run_measurements(self):
+        result, = bench.run(['trie_service.search'], [50], repeat=1)
+        self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+        self.assertGreater(result['queries_per_second'], 0)
+
+    def test_compare(self):
+        baseline = [{'name': 'a', 'size': 1, 'seconds': 1.0}, {'name': 'b', 'size': 1, 'seconds': 1.0}]
+        results = [
+            {'name': 'a', 'size': 1, 'seconds': 1.05},
+            {'name': 'b', 'size': 1, 'seconds': 1.5},
+            {'name': 'c', 'size': 1, 'seconds': 9.0},
+        ]
+        regressions = bench.compare(results, baseline, threshold=0.1)
+        self.assertListEqual(['b'], [regression['name'] for regression in regressions])
+        self.assertAlmostEqual(1.5, regressions[0]['ratio'])
+
+    def test_main_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, 'baseline.json')
+            with open(baseline, 'w') as file:
+                json.dump([{'name': 'trie.search', 'size': 10, 'seconds': 1e-12}], file)
+
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                status = bench.main(['trie.search', '--sizes', '10', '--repeat', '1', '--compare', baseline])
+            self.assertEqual(1, status)
+            self.assertEqual('trie.search', json.loads(stdout.getvalue())[0]['name'])
+            self.assertIn('REGRESSION trie.search size=10', stderr.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,271 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+import tempfile
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import Iterable
+from .trie import Trie
+
+# Layout of the file header written by `CompactTrie.save`: a magic string,
+# the format version, reserved flags, the node count and a CRC-32 of
+# everything after the header. The arrays follow in the order they are
+# listed in `_FILE_ARRAYS`, little-endian, with no padding between them.
+_FILE_HEADER = struct.Struct('<8sIIQI4x')
+_FILE_MAGIC = b'DSATRIE\0'
+_FILE_VERSION = 1
+_FILE_ARRAYS = (('first_child', 'q', 1), ('counts', 'q', 0), ('labels', 'I', 0), ('terminal', 'B', 0))
+
+class CompactTrie:
+    """
+    A frozen, array-backed Trie.
+
+    Nodes are numbered in level order (the root is node 0), which means the
+    children of any node occupy a contiguous run of indices sorted by
+    character. The children of node `i` are the nodes in the range
+    `first_child[i]` to `first_child[i + 1]`, so a whole Trie is described by
+    four flat arrays instead of one object and one dict per node. Labels are
+    stored as code points.
+
+    The arrays may be any buffers that support indexing, which lets `load`
+    back a CompactTrie with views straight into a memory-mapped file.
+    """
+    def __init__(self, labels: array, first_child: array, terminal: bytearray, counts: array):
+        self.labels = labels
+        self.first_child = first_child
+        self.terminal = terminal
+        self.counts = counts
+        self._mapping = None
+
+    @classmethod
+    def from_trie(cls, trie: Trie) -> CompactTrie:
+        """Builds a CompactTrie with the same contents as the given Trie."""
+        nodes = [trie.root]
+        labels = array('I', [0])
+        first_child = array('q')
+        terminal = bytearray([trie.root.is_terminal])
+        counts = array('q', [trie.root.count])
+
+        # The list of nodes doubles as the level order queue.
+        for node in nodes:
+            first_child.append(len(nodes))
+            for character in sorted(node.children):
+                child = node.children[character]
+                nodes.append(child)
+                labels.append(ord(character))
+                terminal.append(child.is_terminal)
+                counts.append(child.count)
+
+        first_child.append(len(nodes))
+        return cls(labels, first_child, terminal, counts)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> CompactTrie:
+        """
+        Builds a CompactTrie directly from a collection of words, without
+        creating an intermediate Trie. Inserting a word more than once is
+        reflected in the node counts, just as with `Trie.insert`.
+        """
+        words = sorted(words)
+        labels = array('I', [0])
+        first_child = array('q')
+        terminal = bytearray([len(words) > 0 and words[0] == ''])
+        counts = array('q', [0])
+
+        # Every node covers the range of sorted words that share its prefix,
+        # kept in flat arrays rather than a list of tuples to bound peak memory.
+        range_lo = array('q', [0])
+        range_hi = array('q', [len(words)])
+        range_depth = array('q', [0])
+        current = 0
+        while current < len(range_lo):
+            lo = range_lo[current]
+            hi = range_hi[current]
+            depth = range_depth[current]
+            first_child.append(len(range_lo))
+            while lo < hi and len(words[lo]) == depth:
+                lo += 1
+
+            while lo < hi:
+                word = words[lo]
+                character = word[depth]
+                # Every word in the range is longer than `depth`, and they
+                # all share the first `depth` characters, so they are
+                # sorted by the character at `depth`.
+                end = bisect_right(words, character, lo, hi, key=itemgetter(depth))
+                range_lo.append(lo)
+                range_hi.append(end)
+                range_depth.append(depth + 1)
+                labels.append(ord(character))
+                terminal.append(len(word) == depth + 1)
+                counts.append(end - lo)
+                lo = end
+
+            current += 1
+
+        first_child.append(len(range_lo))
+        return cls(labels, first_child, terminal, counts)
+
+    def search(self, word: str) -> bool:
+        """Returns whether or not a given word exists in the Trie."""
+        leaf = self.get_leaf(word)
+        return leaf is not None and self.terminal[leaf] == 1
+
+    def get_leaf(self, word: str) -> int | None:
+        """Returns the index of the leaf node of the given word, if it exists."""
+        labels = self.labels
+        first_child = self.first_child
+        current = 0
+        for character in word:
+            lo = first_child[current]
+            hi = first_child[current + 1]
+            code = ord(character)
+            current = bisect_left(labels, code, lo, hi)
+            if current == hi or labels[current] != code:
+                return None
+
+        return current
+
+    def longest_prefix(self, word: str) -> str | None:
+        """Returns the longest prefix of the given word, if one exists."""
+        labels = self.labels
+        first_child = self.first_child
+        terminal = self.terminal
+        current = 0
+        last_terminal = -1
+
+        for idx, character in enumerate(word):
+            lo = first_child[current]
+            hi = first_child[current + 1]
+            code = ord(character)
+            current = bisect_left(labels, code, lo, hi)
+            if current == hi or labels[current] != code:
+                break
+            if terminal[current]:
+                last_terminal = idx
+
+        if last_terminal == -1:
+            return None
+
+        return word[:last_terminal + 1]
+
+    def node_count(self) -> int:
+        """Returns the number of nodes in the Trie, including the root."""
+        return len(self.terminal)
+
+    def nbytes(self) -> int:
+        """Returns the approximate number of bytes used by the Trie's arrays."""
+        return (sys.getsizeof(self.labels) + sys.getsizeof(self.first_child)
+            + sys.getsizeof(self.terminal) + sys.getsizeof(self.counts))
+
+    def save(self, path: str):
+        """
+        Writes the Trie to the given path in a format that `load` can map
+        into memory and query in place.
+
+        The file is written next to the path under a temporary name and then
+        renamed over it, so processes that have the old file loaded keep
+        their mapping of it instead of seeing it truncated.
+        """
+        if sys.byteorder == 'little':
+            parts = [memoryview(getattr(self, name)).cast('B') for name, _, _ in _FILE_ARRAYS]
+        else:
+            parts = [_swap_bytes(getattr(self, name), code) for name, code, _ in _FILE_ARRAYS]
+
+        checksum = 0
+        for part in parts:
+            checksum = zlib.crc32(part, checksum)
+
+        directory, name = os.path.split(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+        try:
+            with open(descriptor, 'wb') as file:
+                file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, 0, self.node_count(), checksum))
+                for part in parts:
+                    file.write(part)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str, verify: bool = False) -> CompactTrie:
+        """
+        Maps a file written by `save` into memory and returns a CompactTrie
+        whose arrays are views into the mapping. Nothing is deserialized, and
+        processes that load the same file share its pages through the OS
+        page cache.
+
+        Checking the checksum reads the whole file, so it is only done when
+        `verify` is set. Raises a ValueError if the file is not a valid trie.
+        """
+        if sys.byteorder != 'little':
+            raise ValueError('memory-mapped tries are only supported on little-endian platforms!')
+
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapping)
+        views = [view]
+        try:
+            if len(view) < _FILE_HEADER.size:
+                raise ValueError('file is too small to be a trie!')
+            magic, version, _, node_count, checksum = _FILE_HEADER.unpack_from(view)
+            if magic != _FILE_MAGIC:
+                raise ValueError('file is not a trie!')
+            if version != _FILE_VERSION:
+                raise ValueError(f'unsupported trie file version {version}!')
+
+            offset = _FILE_HEADER.size
+            arrays = {}
+            for name, code, extra in _FILE_ARRAYS:
+                size = struct.calcsize(code) * (node_count + extra)
+                if offset + size > len(view):
+                    raise ValueError('trie file is truncated!')
+                views.append(view[offset:offset + size])
+                views.append(views[-1].cast(code))
+                arrays[name] = views[-1]
+                offset += size
+
+            if offset != len(view):
+                raise ValueError('trie file has trailing data!')
+            if verify and zlib.crc32(view[_FILE_HEADER.size:]) != checksum:
+                raise ValueError('trie file checksum does not match!')
+        except ValueError:
+            _release(views, mapping)
+            raise
+
+        trie = cls(**arrays)
+        trie._mapping = (mapping, views)
+        return trie
+
+    def close(self):
+        """Unmaps the file backing a Trie returned by `load`, if any."""
+        if self._mapping is not None:
+            mapping, views = self._mapping
+            _release(views, mapping)
+            self._mapping = None
+
+    def __enter__(self) -> CompactTrie:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _swap_bytes(values, code: str) -> bytes:
+    """Returns the given array's items as little-endian bytes."""
+    swapped = array(code, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+def _release(views: list[memoryview], mapping: mmap.mmap):
+    """Releases the views into a memory-mapped file, then unmaps it."""
+    for view in reversed(views):
+        view.release()
+    mapping.close()
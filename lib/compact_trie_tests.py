@@ -0,0 +1,110 @@
+from .compact_trie import CompactTrie
+from .trie import Trie
+import os
+import tempfile
+import unittest
+
+WORDS = ['hello', 'helloworld', 'help', 'world', 'dog', 'dove', 'duck', 'zebra', 'hello']
+
+def _build_trie(words):
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+class TestCompactTrie(unittest.TestCase):
+    def test_search(self):
+        for compact in (CompactTrie.from_trie(_build_trie(WORDS)), CompactTrie.from_words(WORDS)):
+            for word in WORDS:
+                self.assertTrue(compact.search(word))
+            self.assertFalse(compact.search('hel'))
+            self.assertFalse(compact.search('helloworldand'))
+            self.assertFalse(compact.search('foobar'))
+            self.assertFalse(compact.search(''))
+
+    def test_longest_prefix(self):
+        for compact in (CompactTrie.from_trie(_build_trie(WORDS)), CompactTrie.from_words(WORDS)):
+            self.assertEqual('helloworld', compact.longest_prefix('helloworldandallwhoinhabitit'))
+            self.assertEqual('hello', compact.longest_prefix('hellowor'))
+            self.assertEqual('help', compact.longest_prefix('helpful'))
+            self.assertIsNone(compact.longest_prefix('hel'))
+            self.assertIsNone(compact.longest_prefix('foobar'))
+
+    def test_counts_match_trie(self):
+        trie = _build_trie(WORDS)
+        compact = CompactTrie.from_words(WORDS)
+        self.assertEqual(CompactTrie.from_trie(trie).counts, compact.counts)
+        for word in ['h', 'hel', 'hello', 'helloworld', 'd', 'do']:
+            self.assertEqual(trie.get_leaf(word).count, compact.counts[compact.get_leaf(word)])
+
+    def test_same_layout(self):
+        from_trie = CompactTrie.from_trie(_build_trie(WORDS))
+        from_words = CompactTrie.from_words(iter(WORDS))
+        self.assertEqual(from_trie.labels, from_words.labels)
+        self.assertEqual(from_trie.first_child, from_words.first_child)
+        self.assertEqual(from_trie.terminal, from_words.terminal)
+        self.assertEqual(from_trie.node_count(), len(from_trie.labels))
+
+    def test_empty_word(self):
+        compact = CompactTrie.from_words(['', 'a'])
+        self.assertTrue(compact.search(''))
+        self.assertTrue(compact.search('a'))
+        self.assertEqual(0, CompactTrie.from_words([]).get_leaf(''))
+        self.assertIsNone(CompactTrie.from_words([]).get_leaf('a'))
+
+    def test_highest_code_point(self):
+        words = ['a\U0010ffff', 'ab', 'a\U0010ffffz', '\U0010ffff']
+        compact = CompactTrie.from_words(words)
+        self.assertEqual(CompactTrie.from_trie(_build_trie(words)).labels, compact.labels)
+        for word in words:
+            self.assertTrue(compact.search(word))
+        self.assertEqual(2, compact.counts[compact.get_leaf('a\U0010ffff')])
+
+class TestCompactTrieFile(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'words.trie')
+
+    def test_save_load(self):
+        words = WORDS + ['caf\u00e9', '\U0001f600']
+        compact = CompactTrie.from_words(words)
+        compact.save(self.path)
+        with CompactTrie.load(self.path, verify=True) as loaded:
+            for word in words:
+                self.assertTrue(loaded.search(word))
+            self.assertFalse(loaded.search('caf'))
+            self.assertEqual('helloworld', loaded.longest_prefix('helloworldandallwhoinhabitit'))
+            self.assertEqual(list(compact.counts), list(loaded.counts))
+            self.assertEqual(compact.node_count(), loaded.node_count())
+
+    def test_save_over_loaded_file(self):
+        words = [f'word{number}' for number in range(50000)]
+        CompactTrie.from_words(words).save(self.path)
+        with CompactTrie.load(self.path) as loaded:
+            CompactTrie.from_words(['other']).save(self.path)
+            self.assertTrue(all(loaded.search(word) for word in words))
+            self.assertFalse(loaded.search('other'))
+        with CompactTrie.load(self.path, verify=True) as replaced:
+            self.assertTrue(replaced.search('other'))
+            self.assertFalse(replaced.search('word0'))
+        self.assertListEqual(['words.trie'], os.listdir(os.path.dirname(self.path)))
+
+    def test_load_rejects_corrupt_file(self):
+        CompactTrie.from_words(WORDS).save(self.path)
+        with open(self.path, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b'\x07')
+
+        CompactTrie.load(self.path).close()
+        with self.assertRaises(ValueError):
+            CompactTrie.load(self.path, verify=True)
+
+    def test_load_rejects_other_files(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a trie at all, but long enough for a header')
+        with self.assertRaises(ValueError):
+            CompactTrie.load(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+import threading
+from typing import Iterable
+from .trie import Trie, TrieNode
+
+class SnapshotTrie(Trie):
+    """
+    A Trie that can be read from any number of threads while other threads
+    modify it, without readers ever taking a lock.
+
+    Nodes reachable from a published root are never modified. Writers take
+    a lock, copy the nodes on the paths they change, and then publish the
+    new root with a single assignment, so every read sees the Trie exactly
+    as it was before or after each write. Lookups read `self.root` once, so
+    any single call is consistent; use `snapshot` for a consistent view
+    across several calls.
+    """
+    def __init__(self):
+        super().__init__()
+        self._write_lock = threading.Lock()
+
+    def snapshot(self) -> Trie:
+        """
+        Returns a read-only Trie that shares the current version of this
+        Trie's nodes. It must not be modified.
+        """
+        view = Trie()
+        view.root = self.root
+        return view
+
+    def insert(self, word: str):
+        """Inserts a new word into the Trie."""
+        self.bulk_insert((word,))
+
+    def bulk_insert(self, words: Iterable[str]):
+        """Inserts every word from the given iterable, publishing them all at once."""
+        with self._write_lock:
+            root, copied = _begin(self.root)
+            for word in words:
+                _insert(root, word, copied)
+            self.root = root
+
+    def delete(self, word: str):
+        """Deletes a given word from the Trie, if it exists."""
+        with self._write_lock:
+            root, copied = _begin(self.root)
+            _delete(root, word, copied)
+            self.root = root
+
+def _copy_node(node: TrieNode) -> TrieNode:
+    """Returns a copy of the node that shares its children."""
+    copy = TrieNode(node.character, node.count)
+    copy.children = dict(node.children)
+    copy.is_terminal = node.is_terminal
+    return copy
+
+def _begin(root: TrieNode) -> tuple[TrieNode, set[int]]:
+    """
+    Starts a write by copying the root. Returns the copy along with the set
+    of ids of nodes created by the write, which can be modified in place.
+    """
+    root = _copy_node(root)
+    return root, {id(root)}
+
+def _writable_child(parent: TrieNode, character: str, copied: set[int]) -> TrieNode:
+    """
+    Returns the parent's child for the given character, replacing it with a
+    copy first if it may be visible to readers.
+    """
+    child = parent.children[character]
+    if id(child) not in copied:
+        child = _copy_node(child)
+        copied.add(id(child))
+        parent.children[character] = child
+    return child
+
+def _insert(root: TrieNode, word: str, copied: set[int]):
+    """Copy-on-write version of `Trie.insert` below a writable root."""
+    current = root
+    for character in word:
+        if character in current.children:
+            current = _writable_child(current, character, copied)
+            current.count += 1
+        else:
+            child = TrieNode(character)
+            copied.add(id(child))
+            current.add_child(child)
+            current = child
+
+    current.is_terminal = True
+
+def _delete(root: TrieNode, word: str, copied: set[int]):
+    """Copy-on-write version of `Trie.delete` below a writable root."""
+    leaf = root
+    for character in word:
+        leaf = leaf.get_child_with(character)
+        if not leaf:
+            return
+    if not leaf.is_terminal:
+        return
+
+    occurrences = leaf.count - sum(child.count for child in leaf.children.values())
+    current = root
+    for character in word:
+        if current.children[character].count == occurrences:
+            del current.children[character]
+            return
+        current = _writable_child(current, character, copied)
+        current.count -= occurrences
+
+    current.is_terminal = False
@@ -0,0 +1,80 @@
+from .concurrent_trie import SnapshotTrie
+from .trie import Trie
+import threading
+import unittest
+
+class TestSnapshotTrie(unittest.TestCase):
+    def test_insert_delete(self):
+        trie = SnapshotTrie()
+        trie.insert('hello')
+        trie.insert('help')
+        trie.insert('helloworld')
+        self.assertTrue(trie.search('hello'))
+        self.assertEqual(3, trie.get_leaf('hel').count)
+
+        trie.delete('hello')
+        self.assertFalse(trie.search('hello'))
+        self.assertTrue(trie.search('help'))
+        self.assertTrue(trie.search('helloworld'))
+        self.assertEqual(2, trie.get_leaf('hel').count)
+        trie.delete('missing')
+        self.assertListEqual(['helloworld', 'help'], list(trie.iter_prefix('')))
+
+    def test_matches_trie(self):
+        words = ['dog', 'dove', 'duck', 'duck', 'zebra', 'do', '']
+        expected = Trie()
+        trie = SnapshotTrie()
+        expected.bulk_insert(words)
+        trie.bulk_insert(words)
+        for word in ['dove', 'duck', 'do']:
+            expected.delete(word)
+            trie.delete(word)
+        self.assertListEqual(list(expected.iter_prefix('')), list(trie.iter_prefix('')))
+        self.assertListEqual(expected.top_k('', 5), trie.top_k('', 5))
+
+    def test_snapshot_is_unchanged_by_writes(self):
+        trie = SnapshotTrie()
+        trie.insert('hello')
+        snapshot = trie.snapshot()
+        trie.insert('help')
+        trie.delete('hello')
+        self.assertTrue(snapshot.search('hello'))
+        self.assertFalse(snapshot.search('help'))
+        self.assertEqual(1, snapshot.get_leaf('hel').count)
+
+    def test_readers_see_consistent_versions(self):
+        words = [f'word{i:04}' for i in range(500)]
+        trie = SnapshotTrie()
+        errors = []
+        done = threading.Event()
+
+        def reader():
+            while not done.is_set():
+                snapshot = trie.snapshot()
+                present = [word for word in words if snapshot.search(word)]
+                total = sum(child.count for child in snapshot.root.children.values())
+                # Words are inserted in order and deleted in order, so every
+                # version holds one contiguous run of them.
+                if present:
+                    start = words.index(present[0])
+                    if present != words[start:start + len(present)]:
+                        errors.append('torn word set')
+                if total != len(present):
+                    errors.append(f'counts {total} disagree with {len(present)} words')
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for word in words:
+            trie.insert(word)
+        for word in words:
+            trie.delete(word)
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertListEqual([], errors)
+        self.assertEqual(0, len(trie.root.children))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,38 +1,301 @@
+from __future__ import annotations
 import math
+import numbers
+import sys
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
 
 class Fraction:
-    def __init__(self, numerator: int, denominator: int):
-        self.numerator = numerator
-        self.denominator = denominator
+    """
+    An immutable rational number. Fractions are reduced to lowest terms with
+    a positive denominator when they are created, so equal values always
+    have equal numerators and denominators.
+
+    Fractions interoperate with `int` and `fractions.Fraction` in arithmetic,
+    comparisons and hashing. The numerator may itself be any rational number,
+    so `Fraction(fractions.Fraction(1, 2))` is also a half.
+    """
+    __slots__ = ('_numerator', '_denominator')
+
+    def __init__(self, numerator: int, denominator: int = 1):
+        if not isinstance(numerator, int):
+            operands = _operands(numerator)
+            if operands is None:
+                raise TypeError(f'cannot make a Fraction from {type(numerator).__name__}!')
+            numerator, denominator = operands[0], operands[1] * denominator
+        if denominator == 0:
+            raise ZeroDivisionError(f'Fraction({numerator}, 0)')
+        divisor = math.gcd(numerator, denominator)
+        if denominator < 0:
+            divisor = -divisor
+        self._numerator = numerator // divisor
+        self._denominator = denominator // divisor
+
+    @classmethod
+    def _from_reduced(cls, numerator: int, denominator: int) -> Fraction:
+        """Creates a Fraction from a numerator and denominator already in lowest terms."""
+        fraction = object.__new__(cls)
+        fraction._numerator = numerator
+        fraction._denominator = denominator
+        return fraction
+
+    @property
+    def numerator(self) -> int:
+        return self._numerator
+
+    @property
+    def denominator(self) -> int:
+        return self._denominator
+
+    @property
+    def real(self) -> Fraction:
+        return self
+
+    @property
+    def imag(self) -> int:
+        return 0
+
+    def conjugate(self) -> Fraction:
+        return self
+
+    def __add__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(
+            self._numerator * denominator + numerator * self._denominator,
+            self._denominator * denominator)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(
+            self._numerator * denominator - numerator * self._denominator,
+            self._denominator * denominator)
+
+    def __rsub__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(
+            numerator * self._denominator - self._numerator * denominator,
+            self._denominator * denominator)
+
+    def __mul__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(self._numerator * numerator, self._denominator * denominator)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(self._numerator * denominator, self._denominator * numerator)
+
+    def __rtruediv__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(numerator * self._denominator, denominator * self._numerator)
+
+    def __floordiv__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return (self._numerator * denominator) // (self._denominator * numerator)
+
+    def __rfloordiv__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return (numerator * self._denominator) // (denominator * self._numerator)
+
+    def __mod__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(
+            (self._numerator * denominator) % (self._denominator * numerator),
+            self._denominator * denominator)
+
+    def __rmod__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        return Fraction(
+            (numerator * self._denominator) % (denominator * self._numerator),
+            self._denominator * denominator)
+
+    def __divmod__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        return self // other, self % other
+
+    def __rdivmod__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        return other // self, other % self
+
+    def __pow__(self, other):
+        """
+        Raises the Fraction to a power. Integral powers give an exact
+        Fraction; any other power gives a float, like `fractions.Fraction`.
+        """
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        numerator, denominator = operands
+        if denominator != 1:
+            return float(self) ** float(other)
+        if numerator >= 0:
+            return Fraction._from_reduced(self._numerator ** numerator, self._denominator ** numerator)
+        if self._numerator == 0:
+            raise ZeroDivisionError(f'Fraction({self._denominator ** -numerator}, 0)')
+        # Inverting keeps the terms coprime, so only the sign needs moving.
+        numerator, denominator = self._denominator ** -numerator, self._numerator ** -numerator
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return Fraction._from_reduced(numerator, denominator)
+
+    def __rpow__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        if self._denominator == 1:
+            return Fraction(*operands) ** self._numerator
+        return float(other) ** float(self)
+
+    def __neg__(self):
+        return Fraction._from_reduced(-self._numerator, self._denominator)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Fraction._from_reduced(abs(self._numerator), self._denominator)
+
+    def __trunc__(self) -> int:
+        if self._numerator < 0:
+            return -(-self._numerator // self._denominator)
+        return self._numerator // self._denominator
+
+    __int__ = __trunc__
+
+    def __floor__(self) -> int:
+        return self._numerator // self._denominator
+
+    def __ceil__(self) -> int:
+        return -(-self._numerator // self._denominator)
+
+    def __round__(self, ndigits: int | None = None):
+        """
+        Rounds half to even, like the built-in numbers. Returns an int if
+        `ndigits` is not given, and a Fraction otherwise.
+        """
+        if ndigits is None:
+            floor, remainder = divmod(self._numerator, self._denominator)
+            if remainder * 2 < self._denominator:
+                return floor
+            if remainder * 2 > self._denominator:
+                return floor + 1
+            return floor + floor % 2
+        shift = 10 ** abs(ndigits)
+        if ndigits > 0:
+            return Fraction(round(self * shift), shift)
+        return Fraction(round(self / shift) * shift)
+
+    def as_integer_ratio(self) -> tuple[int, int]:
+        return self._numerator, self._denominator
 
     def __eq__(self, other):
-        return self.numerator == other.numerator and self.denominator == other.denominator
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        return self._numerator == operands[0] and self._denominator == operands[1]
+
+    def __lt__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        return self._numerator * operands[1] < operands[0] * self._denominator
 
     def __le__(self, other):
-        return self.numerator * other.denominator <= other.numerator * self.denominator
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        return self._numerator * operands[1] <= operands[0] * self._denominator
 
-    def __sub__(self, other):
-        common_denominator = self.denominator * other.denominator
-        self_numerator = self.numerator * other.denominator
-        other_numerator = other.numerator * self.denominator
-        return _simplify_fraction(Fraction(self_numerator - other_numerator, common_denominator))
+    def __gt__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        return self._numerator * operands[1] > operands[0] * self._denominator
+
+    def __ge__(self, other):
+        operands = _operands(other)
+        if operands is None:
+            return NotImplemented
+        return self._numerator * operands[1] >= operands[0] * self._denominator
+
+    def __hash__(self):
+        # Mirrors the hash of `fractions.Fraction`, so that equal values hash
+        # equally whichever of the two types (or `int`) holds them.
+        try:
+            inverse = pow(self._denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            result = _HASH_INF
+        else:
+            result = hash(hash(abs(self._numerator)) * inverse)
+        result = result if self._numerator >= 0 else -result
+        return -2 if result == -1 else result
+
+    def __bool__(self):
+        return self._numerator != 0
+
+    def __float__(self):
+        return self._numerator / self._denominator
+
+    def __complex__(self):
+        return complex(float(self))
+
+    def __repr__(self):
+        return f'Fraction({self._numerator}, {self._denominator})'
 
     def __str__(self):
-        return f'{self.numerator}/{self.denominator}'
-
-def _simplify_fraction(fraction: Fraction) -> Fraction:
-    """Returns a mathematically simplified version of the given Fraction."""
-    numerator_factors = _factorize(fraction.numerator)
-    denominator_factors = _factorize(fraction.denominator)
-    gcf = list(sorted(numerator_factors.intersection(denominator_factors)))[-1]
-    return Fraction(fraction.numerator // gcf, fraction.denominator // gcf)
-
-def _factorize(number: int) -> set[int]:
-    """Returns a set of the factors for the given number."""
-    factors = set([1, number])
-    for i in range(2, math.floor(math.sqrt(number)) + 1):
-        if number % i == 0:
-            factors.add(i)
-            factors.add(number // i)
-    
-    return factors
+        return f'{self._numerator}/{self._denominator}'
+
+# Lets `fractions.Fraction` and other code written against the numeric
+# tower accept Fractions wherever a rational number is expected.
+numbers.Rational.register(Fraction)
+
+def _operands(other) -> tuple[int, int] | None:
+    """
+    Returns the numerator and denominator of a rational operand, or None if
+    the operand is not a rational number.
+    """
+    if isinstance(other, Fraction):
+        return other._numerator, other._denominator
+    if isinstance(other, int):
+        return other, 1
+    if isinstance(other, numbers.Rational):
+        return other.numerator, other.denominator
+    return None
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import itertools
+import math
+import operator
+from array import array
+from typing import Iterable
+from .fraction import Fraction, _operands
+
+class FractionArray:
+    """
+    A fixed-length sequence of rational numbers, stored as two parallel
+    sequences of numerators and denominators in lowest terms rather than as
+    one Fraction object per value.
+
+    Both sequences are kept in 64-bit integer arrays while every value fits.
+    An operation whose results overflow that range transparently stores them
+    as lists of Python ints instead. Element-wise operations are applied with
+    `map` over builtin functions, so the loops run in C.
+    """
+    def __init__(self, numerators: Iterable[int], denominators: Iterable[int]):
+        numerators, denominators = _reduce(list(numerators), list(denominators))
+        self.numerators = _store(numerators)
+        self.denominators = _store(denominators)
+
+    @classmethod
+    def _from_reduced(cls, numerators, denominators) -> FractionArray:
+        """Creates a FractionArray from values already in lowest terms."""
+        fractions = object.__new__(cls)
+        fractions.numerators = _store(numerators)
+        fractions.denominators = _store(denominators)
+        return fractions
+
+    @classmethod
+    def from_fractions(cls, fractions: Iterable[Fraction]) -> FractionArray:
+        """Creates a FractionArray from any rational numbers, such as Fractions."""
+        numerators = []
+        denominators = []
+        for fraction in fractions:
+            numerators.append(fraction.numerator)
+            denominators.append(fraction.denominator)
+        return cls._from_reduced(numerators, denominators)
+
+    def to_fractions(self) -> list[Fraction]:
+        """Returns the values as a list of Fractions."""
+        return list(map(Fraction._from_reduced, self.numerators, self.denominators))
+
+    def is_int64(self) -> bool:
+        """Returns whether or not the values are stored in 64-bit integer arrays."""
+        return isinstance(self.numerators, array) and isinstance(self.denominators, array)
+
+    def sum(self) -> Fraction:
+        """Returns the sum of all of the values."""
+        common_denominator = math.lcm(*self.denominators)
+        scales = map(operator.floordiv, itertools.repeat(common_denominator), self.denominators)
+        return Fraction(sum(map(operator.mul, self.numerators, scales)), common_denominator)
+
+    def compare(self, other) -> list[int]:
+        """
+        Compares the values element-wise with another FractionArray of the
+        same length or with a single rational number, returning -1, 0 or 1
+        for each value depending on whether it is less than, equal to or
+        greater than the other.
+        """
+        other_numerators, other_denominators = self._operands(other)
+        differences = map(
+            operator.sub,
+            map(operator.mul, self.numerators, other_denominators),
+            map(operator.mul, other_numerators, self.denominators))
+        return [(difference > 0) - (difference < 0) for difference in differences]
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __getitem__(self, index: int) -> Fraction:
+        return Fraction._from_reduced(self.numerators[index], self.denominators[index])
+
+    def __iter__(self):
+        return iter(self.to_fractions())
+
+    def __add__(self, other):
+        other_numerators, other_denominators = self._operands(other)
+        numerators = map(
+            operator.add,
+            map(operator.mul, self.numerators, other_denominators),
+            map(operator.mul, other_numerators, self.denominators))
+        denominators = map(operator.mul, self.denominators, other_denominators)
+        return FractionArray._from_reduced(*_reduce(list(numerators), list(denominators)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other_numerators, other_denominators = self._operands(other)
+        numerators = map(
+            operator.sub,
+            map(operator.mul, self.numerators, other_denominators),
+            map(operator.mul, other_numerators, self.denominators))
+        denominators = map(operator.mul, self.denominators, other_denominators)
+        return FractionArray._from_reduced(*_reduce(list(numerators), list(denominators)))
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        other_numerators, other_denominators = self._operands(other)
+        numerators = map(operator.mul, self.numerators, other_numerators)
+        denominators = map(operator.mul, self.denominators, other_denominators)
+        return FractionArray._from_reduced(*_reduce(list(numerators), list(denominators)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other_numerators, other_denominators = self._operands(other)
+        numerators = map(operator.mul, self.numerators, other_denominators)
+        denominators = map(operator.mul, self.denominators, other_numerators)
+        return FractionArray._from_reduced(*_reduce(list(numerators), list(denominators)))
+
+    def __rtruediv__(self, other):
+        other_numerators, other_denominators = self._operands(other)
+        numerators = map(operator.mul, other_numerators, self.denominators)
+        denominators = map(operator.mul, other_denominators, self.numerators)
+        return FractionArray._from_reduced(*_reduce(list(numerators), list(denominators)))
+
+    def __neg__(self):
+        return FractionArray._from_reduced(list(map(operator.neg, self.numerators)), self.denominators)
+
+    def __repr__(self):
+        values = ', '.join(map(str, self.to_fractions()))
+        return f'FractionArray([{values}])'
+
+    def _operands(self, other) -> tuple[Iterable[int], Iterable[int]]:
+        """
+        Returns the numerators and denominators to combine with this array's
+        values, repeating a single rational number for every value.
+        """
+        if isinstance(other, FractionArray):
+            if len(other) != len(self):
+                raise ValueError('FractionArrays must be of the same length!')
+            return other.numerators, other.denominators
+
+        operands = _operands(other)
+        if operands is None:
+            raise TypeError(f'unsupported operand type: {type(other).__name__}')
+        return itertools.repeat(operands[0]), itertools.repeat(operands[1])
+
+def _reduce(numerators: list[int], denominators: list[int]) -> tuple[list[int], list[int]]:
+    """
+    Returns the given numerators and denominators reduced to lowest terms,
+    with every denominator positive.
+    """
+    if len(numerators) != len(denominators):
+        raise ValueError('numerators and denominators must be of the same length!')
+    if 0 in denominators:
+        raise ZeroDivisionError('FractionArray with a zero denominator')
+
+    divisors = list(map(math.gcd, numerators, denominators))
+    if denominators and min(denominators) < 0:
+        divisors = [-divisor if denominator < 0 else divisor
+            for divisor, denominator in zip(divisors, denominators)]
+    return (list(map(operator.floordiv, numerators, divisors)),
+        list(map(operator.floordiv, denominators, divisors)))
+
+def _store(values: list[int]) -> array | list[int]:
+    """Stores the values in a 64-bit integer array, or a list if any overflow it."""
+    if isinstance(values, array):
+        return values
+    try:
+        return array('q', values)
+    except OverflowError:
+        return list(values)
@@ -0,0 +1,56 @@
+import fractions
+import unittest
+from .fraction import Fraction
+from .fraction_array import FractionArray
+
+class TestFractionArray(unittest.TestCase):
+    def test_construction(self):
+        values = FractionArray([2, 6, 0, 3], [4, -14, 5, 1])
+        self.assertListEqual(
+            [Fraction(1, 2), Fraction(-3, 7), Fraction(0, 1), Fraction(3, 1)],
+            values.to_fractions())
+        self.assertTrue(values.is_int64())
+        self.assertEqual(4, len(values))
+        self.assertEqual(Fraction(-3, 7), values[1])
+        with self.assertRaises(ZeroDivisionError):
+            FractionArray([1], [0])
+        with self.assertRaises(ValueError):
+            FractionArray([1, 2], [3])
+
+    def test_round_trip(self):
+        values = [Fraction(1, 2), Fraction(-7, 3), fractions.Fraction(5, 8)]
+        self.assertListEqual(values, FractionArray.from_fractions(values).to_fractions())
+        self.assertListEqual(values, list(FractionArray.from_fractions(values)))
+
+    def test_arithmetic(self):
+        a = FractionArray([1, 1, 2], [2, 3, 5])
+        b = FractionArray([1, 2, -1], [3, 3, 5])
+        self.assertListEqual([Fraction(5, 6), Fraction(1, 1), Fraction(1, 5)], (a + b).to_fractions())
+        self.assertListEqual([Fraction(1, 6), Fraction(-1, 3), Fraction(3, 5)], (a - b).to_fractions())
+        self.assertListEqual([Fraction(1, 6), Fraction(2, 9), Fraction(-2, 25)], (a * b).to_fractions())
+        self.assertListEqual([Fraction(3, 2), Fraction(1, 2), Fraction(-2, 1)], (a / b).to_fractions())
+        self.assertListEqual([Fraction(3, 2), Fraction(4, 3), Fraction(7, 5)], (a + 1).to_fractions())
+        self.assertListEqual([Fraction(1, 2), Fraction(2, 3), Fraction(3, 5)], (1 - a).to_fractions())
+        self.assertListEqual([Fraction(1, 4), Fraction(1, 6), Fraction(1, 5)], (a * Fraction(1, 2)).to_fractions())
+        self.assertListEqual([Fraction(2, 1), Fraction(3, 1), Fraction(5, 2)], (1 / a).to_fractions())
+        with self.assertRaises(ValueError):
+            a + FractionArray([1], [2])
+
+    def test_compare_and_sum(self):
+        a = FractionArray([1, 1, 2], [2, 3, 5])
+        self.assertListEqual([1, -1, 0], a.compare(FractionArray([1, 1, 4], [3, 2, 10])))
+        self.assertListEqual([1, 0, 1], a.compare(Fraction(1, 3)))
+        self.assertEqual(Fraction(37, 30), a.sum())
+        self.assertEqual(Fraction(0, 1), FractionArray([], []).sum())
+
+    def test_overflow_falls_back_to_python_ints(self):
+        big = 2 ** 40
+        values = FractionArray([1, 1], [big, big + 1])
+        self.assertTrue(values.is_int64())
+        product = values * values
+        self.assertFalse(product.is_int64())
+        self.assertListEqual([Fraction(1, big ** 2), Fraction(1, (big + 1) ** 2)], product.to_fractions())
+        self.assertListEqual([Fraction(1, 1), Fraction(big ** 2, (big + 1) ** 2)], (product * big ** 2).to_fractions())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,7 @@
+import fractions
+import math
+import numbers
+import statistics
 import unittest
 from .fraction import Fraction
 
@@ -14,6 +18,89 @@ class TestFraction(unittest.TestCase):
         self.assertEqual(Fraction(1, 2), Fraction(3, 4) - Fraction(1, 4))
         self.assertEqual(Fraction(1, 12), Fraction(9, 12) - Fraction(2, 3))
         self.assertEqual(Fraction(3, 4), Fraction(19, 23) - Fraction(7, 92))
+        self.assertEqual(Fraction(0, 1), Fraction(2, 3) - Fraction(4, 6))
+
+    def test_normalisation(self):
+        self.assertEqual((3, 7), (Fraction(6, 14).numerator, Fraction(6, 14).denominator))
+        self.assertEqual((-3, 7), (Fraction(6, -14).numerator, Fraction(6, -14).denominator))
+        self.assertEqual((0, 1), (Fraction(0, 5).numerator, Fraction(0, 5).denominator))
+        self.assertEqual('3/7', str(Fraction(-6, -14)))
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(1, 0)
+        with self.assertRaises(AttributeError):
+            Fraction(1, 2).denominator = 3
+
+    def test_arithmetic(self):
+        self.assertEqual(Fraction(5, 6), Fraction(1, 2) + Fraction(1, 3))
+        self.assertEqual(Fraction(1, 6), Fraction(1, 2) * Fraction(1, 3))
+        self.assertEqual(Fraction(3, 2), Fraction(1, 2) / Fraction(1, 3))
+        self.assertEqual(Fraction(-1, 2), -Fraction(1, 2))
+        self.assertEqual(Fraction(1, 2), abs(Fraction(-1, 2)))
+        self.assertEqual(Fraction(3, 2), 1 + Fraction(1, 2))
+        self.assertEqual(Fraction(1, 2), 1 - Fraction(1, 2))
+        self.assertEqual(Fraction(2, 1), 1 / Fraction(1, 2))
+        self.assertEqual(Fraction(3, 1), Fraction(3, 2) * 2)
+        self.assertEqual(0.75, float(Fraction(3, 4)))
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(1, 2) / 0
+
+    def test_comparisons(self):
+        self.assertTrue(Fraction(1, 3) < Fraction(1, 2))
+        self.assertTrue(Fraction(1, 2) > Fraction(1, 3))
+        self.assertTrue(Fraction(1, 2) >= Fraction(2, 4))
+        self.assertTrue(Fraction(-1, 2) < 0)
+        self.assertTrue(Fraction(4, 2) == 2)
+        self.assertFalse(Fraction(1, 2) == 0.5)
+
+    def test_interop(self):
+        self.assertEqual(fractions.Fraction(1, 2), Fraction(2, 4))
+        self.assertEqual(Fraction(2, 4), fractions.Fraction(1, 2))
+        self.assertEqual(fractions.Fraction(5, 6), fractions.Fraction(Fraction(5, 6)))
+        self.assertEqual(Fraction(5, 6), Fraction(1, 2) + fractions.Fraction(1, 3))
+        self.assertIsInstance(fractions.Fraction(1, 3) + Fraction(1, 2), Fraction)
+        self.assertTrue(fractions.Fraction(1, 3) < Fraction(1, 2))
+        for value in [Fraction(1, 2), Fraction(-7, 3), Fraction(4, 1), Fraction(0, 1)]:
+            self.assertEqual(hash(fractions.Fraction(value.numerator, value.denominator)), hash(value))
+        self.assertEqual(hash(4), hash(Fraction(8, 2)))
+        self.assertEqual(1, len({Fraction(1, 2), Fraction(2, 4), fractions.Fraction(1, 2)}))
+        self.assertEqual(Fraction(1, 3), Fraction(fractions.Fraction(2, 3), 2))
+
+    def test_rational_interface(self):
+        for numerator, denominator in [(7, 2), (-7, 2), (5, 2), (-5, 2), (3, 2), (4, 1), (0, 3), (-1, 3)]:
+            value = Fraction(numerator, denominator)
+            expected = fractions.Fraction(numerator, denominator)
+            self.assertEqual(int(expected), int(value))
+            self.assertEqual(math.trunc(expected), math.trunc(value))
+            self.assertEqual(math.floor(expected), math.floor(value))
+            self.assertEqual(math.ceil(expected), math.ceil(value))
+            self.assertEqual(round(expected), round(value))
+            self.assertEqual(round(expected, 1), round(value, 1))
+            self.assertEqual(round(expected, -1), round(value, -1))
+            self.assertEqual(expected // fractions.Fraction(2, 3), value // Fraction(2, 3))
+            self.assertEqual(expected % fractions.Fraction(2, 3), value % Fraction(2, 3))
+            self.assertEqual(7 // expected if numerator else None, 7 // value if numerator else None)
+            self.assertEqual(expected ** 3, value ** 3)
+            self.assertEqual(expected.as_integer_ratio(), value.as_integer_ratio())
+        self.assertEqual(Fraction(4, 9), Fraction(-3, 2) ** -2)
+        self.assertEqual(Fraction(-8, 27), Fraction(-3, 2) ** -3)
+        self.assertEqual(Fraction(8, 1), 2 ** Fraction(3, 1))
+        self.assertAlmostEqual(2.0, Fraction(4, 1) ** Fraction(1, 2))
+        self.assertEqual((1, Fraction(1, 6)), divmod(Fraction(5, 6), Fraction(2, 3)))
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(0, 1) ** -1
+
+        self.assertEqual((1, Fraction(1, 4)), divmod(2, Fraction(7, 4)))
+        value = Fraction(-3, 4)
+        self.assertIs(value, +value)
+        self.assertIs(value, value.real)
+        self.assertIs(value, value.conjugate())
+        self.assertEqual(0, value.imag)
+        self.assertEqual(-0.75 + 0j, complex(value))
+        self.assertIsInstance(value, numbers.Real)
+
+        mean = statistics.mean([Fraction(1, 2), Fraction(1, 3)])
+        self.assertIsInstance(mean, Fraction)
+        self.assertEqual(Fraction(5, 12), mean)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
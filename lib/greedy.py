@@ -1,5 +1,9 @@
-import copy
+import bisect
+import concurrent.futures
+import heapq
 import itertools
+import math
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
 from .fraction import Fraction
 
 def activity_selection_brute(start: list[int], finish: list[int]) -> list[int]:
@@ -42,6 +46,78 @@ def _is_mutually_overlapping(pair1: tuple[int, int], pair2: tuple[int, int]) ->
     """
     return not (pair2[0] > pair1[1] or pair2[1] < pair1[0])
 
+def activity_selection_exact(start: list[int], finish: list[int], workers: int = 1) -> list[int]:
+    """
+    Given two lists of start and end times for a collection of activities,
+    in any order, return the indices of an optimal set of activities that
+    can be completed without overlap. Of all the optimal sets, the one that
+    comes first when their sorted indices are compared lexicographically is
+    returned, so the result is deterministic.
+
+    This is an exact branch and bound search over subsets, meant as a
+    correctness oracle for inputs too large for `activity_selection_brute`.
+    Whenever the activities in their given order already produce an optimal
+    set, the brute force returns exactly this result.
+
+    With more than one worker, the search is split by the first activity
+    in the set, and the parts are solved in a pool of processes.
+    """
+    if len(start) != len(finish):
+        raise ValueError('start and finish arrays must be of the same length!')
+
+    n = len(start)
+    conflicts = [0] * n
+    for i, j in itertools.combinations(range(n), 2):
+        if _is_mutually_overlapping((start[i], finish[i]), (start[j], finish[j])):
+            conflicts[i] |= 1 << j
+            conflicts[j] |= 1 << i
+
+    if workers <= 1:
+        return _activity_selection_search([], (1 << n) - 1, conflicts)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = executor.map(
+            _activity_selection_search,
+            ([first] for first in range(n)),
+            (((1 << n) - 1) & ~((2 << first) - 1) & ~conflicts[first] for first in range(n)),
+            itertools.repeat(conflicts))
+        # Ties are broken towards the smallest first activity, which is the
+        # lexicographically smallest set.
+        return max(parts, key=len, default=[])
+
+def _activity_selection_search(chosen: list[int], candidates: int, conflicts: list[int]) -> list[int]:
+    """
+    Helper function for the exact solution to the Activity Selection Problem.
+    Returns the lexicographically smallest largest set of activities that
+    extends the chosen ones with activities from the candidates bitmask.
+
+    Sets are explored in lexicographic order, and a new best set is only
+    kept when it is strictly larger, so the first set found of the largest
+    size is the lexicographically smallest one. Branches that cannot beat the
+    best set even by taking every remaining candidate are pruned.
+    """
+    best = list(chosen)
+    stack = [(candidates, len(chosen))]
+    chosen = list(chosen)
+
+    while stack:
+        candidates, depth = stack.pop()
+        del chosen[depth:]
+        if depth + candidates.bit_count() <= len(best):
+            continue
+
+        # Take the lowest candidate and push the branch without it, so the
+        # branch with it is explored first.
+        lowest = candidates & -candidates
+        activity = lowest.bit_length() - 1
+        stack.append((candidates ^ lowest, depth))
+        chosen.append(activity)
+        if len(chosen) > len(best):
+            best = list(chosen)
+        stack.append((candidates & ~lowest & ~conflicts[activity], depth + 1))
+
+    return best
+
 def activity_selection_greedy(start: list[int], finish: list[int]) -> list[int]:
     """
     Given two lists of start and end times for a collection of activities,
@@ -62,24 +138,245 @@ def activity_selection_greedy(start: list[int], finish: list[int]) -> list[int]:
 
     return idxs
 
-def egyptian_fractions(fraction: Fraction) -> list[Fraction]:
+def activity_selection(start: list[int], finish: list[int]) -> list[int]:
+    """
+    Given two lists of start and end times for a collection of activities,
+    in any order, return the indices of an optimal set of activities that
+    can be completed without overlap, ordered by finish time.
+
+    Activities are sorted by finish time internally, so this runs in
+    O(n log n). Activities that finish at the same time keep their order.
+    """
+    if len(start) != len(finish):
+        raise ValueError('start and finish arrays must be of the same length!')
+
+    idxs = []
+    last_finish = -math.inf
+    for i in sorted(range(len(start)), key=finish.__getitem__):
+        if start[i] > last_finish:
+            idxs.append(i)
+            last_finish = finish[i]
+
+    return idxs
+
+def activity_selection_stream(intervals: Iterable[tuple[int, int]], window: int = 0) -> Iterator[int]:
+    """
+    Given an iterable of (start, finish) pairs ordered by ascending finish
+    time, lazily yield the index of each activity in an optimal set that
+    can be completed without overlap, as soon as it is accepted. Only a
+    constant amount of state is kept, so the stream may be unbounded.
+
+    If a window is given, the pairs only need to be nearly sorted: each may
+    arrive up to `window` positions away from its place in finish order,
+    and a reorder buffer holding that many pairs restores the order.
+    """
+    selector = _ActivitySelector(window)
+    for index, (start, finish) in enumerate(intervals):
+        yield from selector.push(index, start, finish)
+    yield from selector.flush()
+
+async def activity_selection_stream_async(intervals: AsyncIterable[tuple[int, int]], window: int = 0) -> AsyncIterator[int]:
+    """Asynchronous version of `activity_selection_stream`, for async iterables of pairs."""
+    selector = _ActivitySelector(window)
+    index = 0
+    async for start, finish in intervals:
+        for accepted in selector.push(index, start, finish):
+            yield accepted
+        index += 1
+    for accepted in selector.flush():
+        yield accepted
+
+class _ActivitySelector:
+    """
+    Helper class holding the state of the streaming solutions to the
+    Activity Selection Problem: the finish time of the last accepted
+    activity and the reorder buffer, a heap of (finish, index, start).
+    """
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer = []
+        self.last_finish = -math.inf
+
+    def push(self, index: int, start: int, finish: int) -> list[int]:
+        """Adds an activity to the stream, returning the indices it lets through."""
+        if self.window > 0:
+            heapq.heappush(self.buffer, (finish, index, start))
+            if len(self.buffer) <= self.window:
+                return []
+            finish, index, start = heapq.heappop(self.buffer)
+
+        if start > self.last_finish:
+            self.last_finish = finish
+            return [index]
+        return []
+
+    def flush(self) -> list[int]:
+        """Returns the indices accepted from the activities left in the buffer."""
+        accepted = []
+        while self.buffer:
+            finish, index, start = heapq.heappop(self.buffer)
+            if start > self.last_finish:
+                self.last_finish = finish
+                accepted.append(index)
+        return accepted
+
+def weighted_activity_selection(start: list[int], finish: list[int], weight: list[int]) -> tuple[int, list[int]]:
+    """
+    Given lists of start times, end times and weights for a collection of
+    activities, in any order, return the greatest total weight of a set of
+    activities that can be completed without overlap, along with the indices
+    of those activities ordered by finish time.
+
+    This is the dynamic programming solution to the problem, which finds the
+    last compatible activity for each one with a binary search.
+    """
+    if not len(start) == len(finish) == len(weight):
+        raise ValueError('start, finish and weight arrays must be of the same length!')
+
+    order = sorted(range(len(start)), key=finish.__getitem__)
+    finishes = [finish[i] for i in order]
+
+    # best[j] is the greatest total weight using only the first j activities
+    # in finish order, and compatible[j] is how many of those first j finish
+    # before activity j starts.
+    best = [0] * (len(order) + 1)
+    compatible = [0] * len(order)
+    for j, i in enumerate(order):
+        compatible[j] = bisect.bisect_left(finishes, start[i], 0, j)
+        best[j + 1] = max(best[j], weight[i] + best[compatible[j]])
+
+    idxs = []
+    j = len(order)
+    while j > 0:
+        i = order[j - 1]
+        if weight[i] + best[compatible[j - 1]] > best[j - 1]:
+            idxs.append(i)
+            j = compatible[j - 1]
+        else:
+            j -= 1
+
+    idxs.reverse()
+    return best[-1], idxs
+
+def egyptian_fractions(fraction: Fraction, method: str = 'greedy') -> list[Fraction]:
     """
     Computes the "Egyptian Fractions" for a given Fraction.
     This can be defined as the list of unit fractions (fractions with a
     numerator of 1) whose sum equals the given fraction.
+
+    The components are distinct, never 1/1, and returned in order of
+    ascending denominator. The method can be one of:
+
+    - 'greedy': repeatedly takes the largest unit fraction that fits
+      (Fibonacci-Sylvester). Gives few terms, but denominators can grow
+      doubly exponentially.
+    - 'binary': the binary remainder method, which splits the fraction over
+      the next power of two above its denominator. Denominators are bounded
+      by twice the square of the denominator. Proper fractions only.
+    - 'golomb': Golomb's method, which peels off one unit fraction per step
+      using the inverse of the numerator modulo the denominator. Gives at
+      most n terms for n/d, with denominators bounded by d(d - 1). Proper
+      fractions only.
+    """
+    if method not in _EGYPTIAN_FRACTION_METHODS:
+        raise ValueError(f'unknown Egyptian fraction method {method!r}!')
+    _check_egyptian_fraction(fraction.numerator, fraction.denominator, method)
+
+    denominators = _EGYPTIAN_FRACTION_METHODS[method](fraction.numerator, fraction.denominator)
+    return [Fraction._from_reduced(1, denominator) for denominator in denominators]
+
+def egyptian_fractions_batch(fractions: list[Fraction], method: str = 'greedy') -> list[list[Fraction]]:
+    """
+    Computes the Egyptian Fractions for each of the given Fractions. The
+    method is looked up once for the whole batch, and a value that appears
+    more than once is only expanded the first time. Each result is its own
+    list.
     """
-    temp = copy.copy(fraction)
-    candidate = Fraction(1, 2)
-    components = []
+    if method not in _EGYPTIAN_FRACTION_METHODS:
+        raise ValueError(f'unknown Egyptian fraction method {method!r}!')
+    expand = _EGYPTIAN_FRACTION_METHODS[method]
 
-    while temp.numerator != 0:
-        if candidate <= temp:
-            temp -= candidate
-            components.append(copy.copy(candidate))
+    expansions = {}
+    results = []
+    for fraction in fractions:
+        terms = (fraction.numerator, fraction.denominator)
+        expansion = expansions.get(terms)
+        if expansion is None:
+            _check_egyptian_fraction(*terms, method)
+            expansion = [Fraction._from_reduced(1, denominator) for denominator in expand(*terms)]
+            expansions[terms] = expansion
+        results.append(expansion.copy())
+    return results
 
-        candidate.denominator += 1
+def _check_egyptian_fraction(numerator: int, denominator: int, method: str):
+    """Raises a ValueError if the given method cannot expand the fraction."""
+    if numerator < 0:
+        raise ValueError('fraction must not be negative!')
+    if method != 'greedy' and numerator >= denominator:
+        raise ValueError(f'the {method!r} method requires a fraction less than one!')
 
-    return components
+def _egyptian_fractions_greedy(numerator: int, denominator: int) -> list[int]:
+    """
+    Helper function for the greedy method of computing Egyptian Fractions.
+    Rather than trying every denominator in turn, each step jumps straight
+    to the smallest unused denominator whose unit fraction still fits.
+    """
+    denominators = []
+    candidate = 2
+    while numerator:
+        candidate = max(candidate, -(-denominator // numerator))
+        denominators.append(candidate)
+        numerator = numerator * candidate - denominator
+        denominator *= candidate
+        divisor = math.gcd(numerator, denominator)
+        numerator //= divisor
+        denominator //= divisor
+        candidate += 1
+
+    return denominators
+
+def _egyptian_fractions_binary(numerator: int, denominator: int) -> list[int]:
+    """
+    Helper function for the binary remainder method of computing Egyptian
+    Fractions. With N the smallest power of two no less than the denominator,
+    the fraction is split into q/N + r/(N * denominator), where q and r are
+    both below N. Each set bit of q and r then gives one unit fraction.
+    """
+    exponent = (denominator - 1).bit_length()
+    quotient, remainder = divmod(numerator << exponent, denominator)
+
+    denominators = []
+    for bit in range(exponent):
+        if quotient >> bit & 1:
+            denominators.append(1 << (exponent - bit))
+        if remainder >> bit & 1:
+            denominators.append(denominator << (exponent - bit))
+
+    return sorted(denominators)
+
+def _egyptian_fractions_golomb(numerator: int, denominator: int) -> list[int]:
+    """
+    Helper function for Golomb's method of computing Egyptian Fractions.
+    With x the inverse of the numerator modulo the denominator, so that
+    numerator * x = 1 + k * denominator, the fraction is split into
+    k/x + 1/(x * denominator). Since x is below the denominator and k below
+    the numerator, each step shrinks both terms of what remains.
+    """
+    denominators = []
+    while numerator > 1:
+        inverse = pow(numerator, -1, denominator)
+        denominators.append(inverse * denominator)
+        numerator, denominator = (numerator * inverse - 1) // denominator, inverse
+    if numerator:
+        denominators.append(denominator)
+
+    return sorted(denominators)
+
+_EGYPTIAN_FRACTION_METHODS = {
+    'greedy': _egyptian_fractions_greedy,
+    'binary': _egyptian_fractions_binary,
+    'golomb': _egyptian_fractions_golomb,
+}
 
 def job_sequencing_problem_greedy(jobs: list[tuple[str, int, int]]) -> list[str]:
     """
@@ -89,14 +386,39 @@ def job_sequencing_problem_greedy(jobs: list[tuple[str, int, int]]) -> list[str]
 
     The result is returned in sorted order.
     """
-    n = max(jobs, key=lambda job: job[1])[1] + 1
-    sorted_jobs = list(reversed(sorted(jobs, key=lambda job: job[2])))
-    slots = ['' for _ in range(n)]
+    _, scheduled = job_sequencing(jobs)
+    return [job for _, job in scheduled]
 
-    for job in sorted_jobs:
-        for j in range(job[1], 0, -1):
-            if not slots[j]:
-                slots[j] = job[0]
-                break
-    
-    return list(filter(lambda slot: slot != '', slots))
+def job_sequencing(jobs: list[tuple[str, int, int]]) -> tuple[int, list[tuple[int, str]]]:
+    """
+    Given a list of jobs and their deadline and profit values, select the
+    sequence of jobs that produce the maximum amount of profit, and return
+    the total profit along with (slot, job) pairs in slot order. Slots are
+    numbered from 1, and each job is placed in the latest free slot no later
+    than its deadline.
+
+    Free slots are found with a disjoint-set forest in which every used slot
+    points towards the next slot below it that may still be free. Only used
+    slots are stored, so this runs in near-linear time however large the
+    deadlines are.
+    """
+    parent = {}
+    total = 0
+    scheduled = []
+
+    for job, deadline, profit in reversed(sorted(jobs, key=lambda job: job[2])):
+        slot = deadline
+        while slot in parent:
+            slot = parent[slot]
+        # Path compression: point every slot visited at the free slot found.
+        visited = deadline
+        while visited != slot:
+            parent[visited], visited = slot, parent[visited]
+
+        if slot > 0:
+            parent[slot] = slot - 1
+            total += profit
+            scheduled.append((slot, job))
+
+    scheduled.sort()
+    return total, scheduled
@@ -1,5 +1,9 @@
+import asyncio
+import itertools
+import random
 import unittest
-from .greedy import activity_selection_brute, activity_selection_greedy, egyptian_fractions, job_sequencing_problem_greedy
+from .greedy import (activity_selection, activity_selection_brute, activity_selection_exact, activity_selection_greedy,
+    activity_selection_stream, activity_selection_stream_async, egyptian_fractions, egyptian_fractions_batch, job_sequencing, job_sequencing_problem_greedy, weighted_activity_selection)
 from .fraction import Fraction
 
 class ActivitySelectionTests(unittest.TestCase):
@@ -9,44 +13,202 @@ class ActivitySelectionTests(unittest.TestCase):
         optimal = activity_selection_brute(start, finish)
         self.assertEqual([0, 1, 3, 4], optimal)
 
+    def test_activity_selection_exact(self):
+        start = [1, 3, 0, 5, 8, 5]
+        finish = [2, 4, 6, 7, 9, 9]
+        self.assertEqual(activity_selection_brute(start, finish), activity_selection_exact(start, finish))
+        self.assertEqual([0, 1, 3, 4], activity_selection_exact(start, finish, workers=2))
+        self.assertEqual([], activity_selection_exact([], []))
+
+    def test_activity_selection_exact_is_lexicographically_smallest(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            n = rng.randint(1, 9)
+            start = [rng.randint(0, 10) for _ in range(n)]
+            finish = [s + rng.randint(0, 4) for s in start]
+            feasible = [list(subset)
+                for size in range(n, 0, -1)
+                for subset in itertools.combinations(range(n), size)
+                if all(start[b] > finish[a] or start[a] > finish[b]
+                    for a, b in itertools.combinations(subset, 2))]
+            self.assertEqual(feasible[0], activity_selection_exact(start, finish))
+
+        start = [rng.randint(0, 100) for _ in range(40)]
+        finish = [s + rng.randint(0, 10) for s in start]
+        serial = activity_selection_exact(start, finish)
+        self.assertEqual(len(activity_selection(start, finish)), len(serial))
+        self.assertEqual(serial, activity_selection_exact(start, finish, workers=2))
+
     def test_activity_selection_greedy(self):
         start = [1, 3, 0, 5, 8, 5]
         finish = [2, 4, 6, 7, 9, 9]
         optimal = activity_selection_greedy(start, finish)
         self.assertEqual([0, 1, 3, 4], optimal)
     
-    def test_egyptian_fractions(self):
-        # Some tests require fraction simplification.
+    def test_activity_selection(self):
+        start = [1, 3, 0, 5, 8, 5]
+        finish = [2, 4, 6, 7, 9, 9]
+        self.assertEqual([0, 1, 3, 4], activity_selection(start, finish))
+
+        start = [8, 0, 3, 5, 1, 5]
+        finish = [9, 6, 4, 9, 2, 7]
+        self.assertEqual([4, 2, 5, 0], activity_selection(start, finish))
+        self.assertEqual([], activity_selection([], []))
+
+    def test_activity_selection_matches_brute(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            n = rng.randint(1, 6)
+            start = [rng.randint(0, 10) for _ in range(n)]
+            finish = [s + rng.randint(0, 4) for s in start]
+            idxs = activity_selection(start, finish)
+            self.assertEqual(len(activity_selection_brute(start, finish)), len(idxs))
+            for a, b in zip(idxs, idxs[1:]):
+                self.assertGreater(start[b], finish[a])
+
+    def test_activity_selection_stream(self):
+        start = [1, 3, 0, 5, 8, 5]
+        finish = [2, 4, 6, 7, 9, 9]
+        self.assertEqual([0, 1, 3, 4], list(activity_selection_stream(zip(start, finish))))
+
+        # The stream is consumed lazily, so it can be unbounded.
+        bookings = ((i * 10, i * 10 + 5) for i in itertools.count())
+        self.assertEqual([0, 1, 2], list(itertools.islice(activity_selection_stream(bookings), 3)))
+
+    def test_activity_selection_stream_window(self):
+        rng = random.Random(0)
+        finish = sorted(rng.sample(range(2000), 200))
+        start = [f - rng.randint(0, 30) for f in finish]
+        pairs = list(zip(start, finish))
+        order = list(range(len(pairs)))
+        for i in range(0, len(order) - 3, 4):
+            order[i:i + 4] = reversed(order[i:i + 4])
+
+        shuffled = [pairs[i] for i in order]
+        expected = [order.index(i) for i in activity_selection(start, finish)]
+        self.assertEqual(expected, list(activity_selection_stream(shuffled, window=3)))
+
+    def test_activity_selection_stream_async(self):
+        async def bookings():
+            for pair in [(1, 2), (3, 4), (0, 6), (5, 7), (8, 9), (5, 9)]:
+                yield pair
+
+        async def collect():
+            return [i async for i in activity_selection_stream_async(bookings())]
 
+        self.assertEqual([0, 1, 3, 4], asyncio.run(collect()))
+
+    def test_weighted_activity_selection(self):
+        start = [1, 3, 0, 5, 8, 5]
+        finish = [2, 4, 6, 7, 9, 9]
+        weight = [1, 1, 10, 1, 1, 1]
+        self.assertEqual((11, [2, 4]), weighted_activity_selection(start, finish, weight))
+        self.assertEqual((0, []), weighted_activity_selection([], [], []))
+
+        rng = random.Random(0)
+        for _ in range(30):
+            n = rng.randint(1, 7)
+            start = [rng.randint(0, 10) for _ in range(n)]
+            finish = [s + rng.randint(0, 4) for s in start]
+            weight = [rng.randint(1, 9) for _ in range(n)]
+            expected = max(
+                sum(weight[i] for i in subset)
+                for size in range(n + 1)
+                for subset in itertools.combinations(range(n), size)
+                if all(start[b] > finish[a] or start[a] > finish[b]
+                    for a, b in itertools.combinations(subset, 2)))
+            total, idxs = weighted_activity_selection(start, finish, weight)
+            self.assertEqual(expected, total)
+            self.assertEqual(expected, sum(weight[i] for i in idxs))
+            for a, b in zip(idxs, idxs[1:]):
+                self.assertGreater(start[b], finish[a])
+
+    def test_egyptian_fractions(self):
         ans1 = egyptian_fractions(Fraction(2, 3))
-        # ans2 = egyptian_fractions(Fraction(6, 14))
-        # ans3 = egyptian_fractions(Fraction(12, 13))
+        ans2 = egyptian_fractions(Fraction(6, 14))
+        ans3 = egyptian_fractions(Fraction(12, 13))
 
         self.assertEqual(2, len(ans1))
-        # self.assertEqual(3, len(ans2))
-        # self.assertEqual(4, len(ans3))
+        self.assertEqual(3, len(ans2))
+        self.assertEqual(4, len(ans3))
 
         self.assertEqual(1, ans1[0].numerator)
         self.assertEqual(2, ans1[0].denominator)
         self.assertEqual(1, ans1[1].numerator)
         self.assertEqual(6, ans1[1].denominator)
 
-        # self.assertEqual(1, ans2[0].numerator)
-        # self.assertEqual(3, ans2[0].denominator)
-        # self.assertEqual(1, ans2[1].numerator)
-        # self.assertEqual(11, ans2[1].denominator)
-        # self.assertEqual(1, ans2[2].numerator)
-        # self.assertEqual(231, ans2[2].denominator)
-
-        # self.assertEqual(1, ans3[0].numerator)
-        # self.assertEqual(2, ans3[0].denominator)
-        # self.assertEqual(1, ans3[1].numerator)
-        # self.assertEqual(3, ans3[1].denominator)
-        # self.assertEqual(1, ans3[2].numerator)
-        # self.assertEqual(12, ans3[2].denominator)
-        # self.assertEqual(1, ans3[3].numerator)
-        # self.assertEqual(156, ans3[3].denominator)
+        self.assertEqual(1, ans2[0].numerator)
+        self.assertEqual(3, ans2[0].denominator)
+        self.assertEqual(1, ans2[1].numerator)
+        self.assertEqual(11, ans2[1].denominator)
+        self.assertEqual(1, ans2[2].numerator)
+        self.assertEqual(231, ans2[2].denominator)
+
+        self.assertEqual(1, ans3[0].numerator)
+        self.assertEqual(2, ans3[0].denominator)
+        self.assertEqual(1, ans3[1].numerator)
+        self.assertEqual(3, ans3[1].denominator)
+        self.assertEqual(1, ans3[2].numerator)
+        self.assertEqual(12, ans3[2].denominator)
+        self.assertEqual(1, ans3[3].numerator)
+        self.assertEqual(156, ans3[3].denominator)
     
+    def test_egyptian_fractions_methods(self):
+        fractions = [Fraction(2, 3), Fraction(6, 14), Fraction(5, 121), Fraction(1, 2), Fraction(0, 1)]
+        for method in ['greedy', 'binary', 'golomb']:
+            for fraction in fractions:
+                components = egyptian_fractions(fraction, method)
+                denominators = [component.denominator for component in components]
+                self.assertEqual(fraction, sum(components, Fraction(0, 1)))
+                self.assertTrue(all(component.numerator == 1 for component in components))
+                self.assertListEqual(sorted(set(denominators)), denominators)
+                self.assertNotIn(1, denominators)
+
+        self.assertListEqual(
+            [Fraction(1, 2), Fraction(1, 3), Fraction(1, 4), Fraction(1, 17), Fraction(1, 1428)],
+            egyptian_fractions(Fraction(8, 7)))
+        self.assertEqual(5, len(egyptian_fractions(Fraction(12, 13), 'binary')))
+        self.assertListEqual(
+            [Fraction(1, 2), Fraction(1, 4), Fraction(1, 16), Fraction(1, 52), Fraction(1, 104), Fraction(1, 208)],
+            egyptian_fractions(Fraction(11, 13), 'binary'))
+        self.assertListEqual(
+            [Fraction(1, 3), Fraction(1, 15)],
+            egyptian_fractions(Fraction(2, 5), 'golomb'))
+
+    def test_egyptian_fractions_golomb_bounds(self):
+        for denominator in range(2, 60):
+            for numerator in range(1, denominator):
+                fraction = Fraction(numerator, denominator)
+                components = egyptian_fractions(fraction, 'golomb')
+                denominators = [component.denominator for component in components]
+                self.assertEqual(fraction, sum(components, Fraction(0, 1)))
+                self.assertEqual(len(set(denominators)), len(denominators))
+                self.assertLessEqual(len(denominators), fraction.numerator)
+                self.assertLessEqual(max(denominators), fraction.denominator * (fraction.denominator - 1))
+
+    def test_egyptian_fractions_invalid(self):
+        with self.assertRaises(ValueError):
+            egyptian_fractions(Fraction(1, 2), 'unknown')
+        with self.assertRaises(ValueError):
+            egyptian_fractions(Fraction(-1, 2))
+        with self.assertRaises(ValueError):
+            egyptian_fractions(Fraction(3, 2), 'binary')
+
+    def test_egyptian_fractions_batch(self):
+        fractions = [Fraction(2, 3), Fraction(6, 14)]
+        self.assertListEqual(
+            [egyptian_fractions(fraction, 'binary') for fraction in fractions],
+            egyptian_fractions_batch(fractions, 'binary'))
+
+        results = egyptian_fractions_batch([Fraction(2, 3), Fraction(4, 6), Fraction(3, 7)], 'golomb')
+        self.assertListEqual(results[0], results[1])
+        self.assertIsNot(results[0], results[1])
+        self.assertListEqual(egyptian_fractions(Fraction(3, 7), 'golomb'), results[2])
+        with self.assertRaises(ValueError):
+            egyptian_fractions_batch([Fraction(1, 2)], 'splitting')
+        with self.assertRaises(ValueError):
+            egyptian_fractions_batch([Fraction(1, 2), Fraction(3, 2)], 'binary')
+
     def test_job_sequencing_problem(self):
         jobs = [('a', 4, 20), ('b', 1, 10), ('c', 1, 40), ('d', 1, 30)]
         self.assertCountEqual(['c', 'a'], job_sequencing_problem_greedy(jobs))
@@ -54,5 +216,28 @@ class ActivitySelectionTests(unittest.TestCase):
         jobs = [('a', 2, 100), ('b', 1, 19), ('c', 2, 27), ('d', 1, 25), ('e', 3, 15)]
         self.assertCountEqual(['a', 'c', 'e'], job_sequencing_problem_greedy(jobs))
 
+    def test_job_sequencing(self):
+        jobs = [('a', 2, 100), ('b', 1, 19), ('c', 2, 27), ('d', 1, 25), ('e', 3, 15)]
+        self.assertEqual((142, [(1, 'c'), (2, 'a'), (3, 'e')]), job_sequencing(jobs))
+        self.assertEqual((0, []), job_sequencing([]))
+        self.assertEqual((0, []), job_sequencing([('a', 0, 10)]))
+
+        jobs = [('a', 10 ** 12, 5), ('b', 10 ** 12, 7), ('c', 2, 1)]
+        self.assertEqual((13, [(2, 'c'), (10 ** 12 - 1, 'a'), (10 ** 12, 'b')]), job_sequencing(jobs))
+
+    def test_job_sequencing_matches_linear_scan(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            jobs = [(str(i), rng.randint(1, 8), rng.randint(1, 50)) for i in range(rng.randint(1, 12))]
+            slots = {}
+            for job, deadline, profit in reversed(sorted(jobs, key=lambda job: job[2])):
+                for slot in range(deadline, 0, -1):
+                    if slot not in slots:
+                        slots[slot] = (job, profit)
+                        break
+            expected = (sum(profit for _, profit in slots.values()),
+                [(slot, slots[slot][0]) for slot in sorted(slots)])
+            self.assertEqual(expected, job_sequencing(jobs))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+class RadixNode:
+    def __init__(self, label='', count=1):
+        self.label = label
+        self.children = {}
+        self.is_terminal = False
+        self.count = count
+
+    def get_child_with(self, character: str) -> RadixNode | None:
+        """Return the child whose label starts with the given character, or None if none exist."""
+        return self.children.get(character)
+
+    def has_children(self) -> bool:
+        """Return whether or not the node has children."""
+        return len(self.children) > 0
+
+    def split(self, length: int):
+        """
+        Splits the node's label after the given number of characters, moving
+        the remainder of the label into a new, single child node.
+        """
+        rest = RadixNode(self.label[length:], self.count)
+        rest.children = self.children
+        rest.is_terminal = self.is_terminal
+        self.label = self.label[:length]
+        self.children = {rest.label[0]: rest}
+        self.is_terminal = False
+
+    def merge(self):
+        """Absorbs the node's only child, joining their labels."""
+        (child,) = self.children.values()
+        self.label += child.label
+        self.children = child.children
+        self.is_terminal = child.is_terminal
+
+class RadixTrie:
+    """
+    A Trie whose chains of single-child nodes are compressed into one node
+    labelled with the whole substring, so lookups take one dict hop per
+    branch rather than per character.
+
+    Every character of a node's label shares the same count, so the counts
+    mean the same thing as the per-character counts of `Trie`.
+    """
+    def __init__(self):
+        self.root = RadixNode(count=0)
+
+    def search(self, word: str) -> bool:
+        """Returns whether or not a given word exists in the Trie."""
+        current = self.root
+        i = 0
+        while i < len(word):
+            current = current.children.get(word[i])
+            if not current or not word.startswith(current.label, i):
+                return False
+            i += len(current.label)
+
+        return current.is_terminal
+
+    def insert(self, word: str):
+        """Inserts a new word into the Trie."""
+        current = self.root
+        i = 0
+        while i < len(word):
+            child = current.get_child_with(word[i])
+            if not child:
+                child = RadixNode(word[i:])
+                child.is_terminal = True
+                current.children[word[i]] = child
+                return
+
+            label = child.label
+            if not word.startswith(label, i):
+                shared = 1
+                while i + shared < len(word) and word[i + shared] == label[shared]:
+                    shared += 1
+                child.split(shared)
+
+            child.count += 1
+            i += len(child.label)
+            current = child
+
+        current.is_terminal = True
+
+    def delete(self, word: str):
+        """
+        Deletes a given word from the Trie. Counts along the word's path are
+        reduced by the number of times the word was inserted.
+        """
+        path = self._find_path(word)
+        if path is None or not path[-1].is_terminal:
+            return
+
+        leaf = path[-1]
+        occurrences = leaf.count - sum(child.count for child in leaf.children.values())
+        for node in path[1:]:
+            node.count -= occurrences
+        leaf.is_terminal = False
+
+        if leaf is self.root:
+            return
+
+        parent = path[-2]
+        if not leaf.has_children():
+            del parent.children[leaf.label[0]]
+            if parent is not self.root and not parent.is_terminal and len(parent.children) == 1:
+                parent.merge()
+        elif len(leaf.children) == 1:
+            leaf.merge()
+
+    def longest_prefix(self, word: str) -> str | None:
+        """Returns the longest prefix of the given word, if one exists."""
+        current = self.root
+        i = 0
+        last_terminal = -1
+
+        while i < len(word):
+            child = current.get_child_with(word[i])
+            if not child or not word.startswith(child.label, i):
+                break
+            i += len(child.label)
+            current = child
+            if current.is_terminal:
+                last_terminal = i
+
+        if last_terminal == -1:
+            return None
+
+        return word[:last_terminal]
+
+    def node_count(self) -> int:
+        """Returns the number of nodes in the Trie, including the root."""
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+
+        return count
+
+    def _find_path(self, word: str) -> list[RadixNode] | None:
+        """
+        Returns the nodes from the root to the node ending exactly at the end
+        of the given word, or None if the word does not end on a node.
+        """
+        current = self.root
+        path = [current]
+        i = 0
+        while i < len(word):
+            current = current.get_child_with(word[i])
+            if not current or not word.startswith(current.label, i):
+                return None
+            i += len(current.label)
+            path.append(current)
+
+        return path
+
+def shortest_unique_prefix(trie: RadixTrie) -> list[str]:
+    """Returns a list of the shortest unique prefixes in the Trie."""
+    prefixes = []
+    stack = [(child, '') for child in reversed(trie.root.children.values())]
+
+    while stack:
+        node, running_string = stack.pop()
+        # The whole label shares the node's count, so a unique prefix always
+        # ends on the label's first character.
+        if node.count == 1:
+            prefixes.append(running_string + node.label[0])
+            continue
+
+        running_string += node.label
+        for child in reversed(node.children.values()):
+            stack.append((child, running_string))
+
+    return prefixes
@@ -0,0 +1,94 @@
+from .radix_trie import RadixTrie, shortest_unique_prefix
+from .trie import Trie, shortest_unique_prefix as trie_shortest_unique_prefix
+import random
+import unittest
+
+class TestRadixTrie(unittest.TestCase):
+    def test_insert_search(self):
+        trie = RadixTrie()
+        trie.insert('hello')
+        trie.insert('world')
+        self.assertTrue(trie.search('hello'))
+        self.assertTrue(trie.search('world'))
+        self.assertFalse(trie.search('foobar'))
+        self.assertFalse(trie.search('hell'))
+
+    def test_split_and_merge(self):
+        trie = RadixTrie()
+        trie.insert('/usr/local/bin')
+        self.assertEqual(2, trie.node_count())
+        trie.insert('/usr/local/lib')
+        trie.insert('/usr')
+        self.assertEqual(5, trie.node_count())
+        self.assertTrue(trie.search('/usr'))
+        self.assertFalse(trie.search('/usr/local/'))
+
+        trie.delete('/usr/local/lib')
+        self.assertEqual(3, trie.node_count())
+        self.assertTrue(trie.search('/usr/local/bin'))
+        trie.delete('/usr')
+        self.assertEqual(2, trie.node_count())
+        self.assertTrue(trie.search('/usr/local/bin'))
+        self.assertFalse(trie.search('/usr'))
+
+    def test_delete_with_prefix_intact(self):
+        trie = RadixTrie()
+        trie.insert('hello')
+        trie.insert('helloworld')
+        trie.delete('helloworld')
+        self.assertFalse(trie.search('helloworld'))
+        self.assertTrue(trie.search('hello'))
+        trie.delete('missing')
+        self.assertTrue(trie.search('hello'))
+
+    def test_longest_prefix(self):
+        trie = RadixTrie()
+        trie.insert('hello')
+        trie.insert('helloworld')
+        self.assertEqual('helloworld', trie.longest_prefix('helloworld'))
+        self.assertEqual('helloworld', trie.longest_prefix('helloworldandallwhoinhabitit'))
+        self.assertEqual('hello', trie.longest_prefix('hellowor'))
+        self.assertIsNone(trie.longest_prefix('hell'))
+        self.assertIsNone(trie.longest_prefix('foobar'))
+
+    def test_matches_trie(self):
+        rng = random.Random(0)
+        words = [''.join(rng.choices('ab/', k=rng.randint(1, 8))) for _ in range(200)]
+        trie = Trie()
+        radix = RadixTrie()
+        for word in words:
+            trie.insert(word)
+            radix.insert(word)
+
+        self.assertCountEqual(trie_shortest_unique_prefix(trie), shortest_unique_prefix(radix))
+        for word in words + ['', 'ab/ab/ab/ab', 'zzz']:
+            self.assertEqual(trie.search(word), radix.search(word))
+            self.assertEqual(trie.longest_prefix(word), radix.longest_prefix(word))
+
+        expected = set(words)
+        for word in words[::3]:
+            radix.delete(word)
+            expected.discard(word)
+        for word in words:
+            self.assertEqual(word in expected, radix.search(word))
+
+class TestRadixTrieFunctions(unittest.TestCase):
+    def test_shortest_unique_prefix(self):
+        trie = RadixTrie()
+        trie.insert('zebra')
+        trie.insert('dog')
+        trie.insert('duck')
+        trie.insert('dove')
+        prefixes = shortest_unique_prefix(trie)
+        self.assertCountEqual(['dog', 'dov', 'du', 'z'], prefixes)
+
+    def test_shortest_unique_prefix_after_delete(self):
+        trie = RadixTrie()
+        trie.insert('dog')
+        trie.insert('dove')
+        trie.insert('dove')
+        trie.delete('dove')
+        self.assertCountEqual(['d'], shortest_unique_prefix(trie))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,281 @@
+from __future__ import annotations
+import heapq
+import itertools
+import multiprocessing
+import os
+import pickle
+import weakref
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable
+from .trie import Trie, shortest_unique_prefix as _shortest_unique_prefix
+
+# Messages at least this many bytes long are passed through shared memory
+# rather than written through the pipe.
+_SHARED_MEMORY_THRESHOLD = 1 << 16
+
+class ShardedTrie:
+    """
+    A Trie split across worker processes, each holding the words of one
+    shard in its own Trie, so inserts on different shards run in parallel
+    and the words need not fit in one process.
+
+    Words are assigned to shards either by a hash of the whole word, which
+    spreads them evenly, or by their first character, which keeps every
+    word with a given prefix on one shard so prefix queries only reach that
+    shard. Operations on single words go to the shard that owns the word;
+    the batch versions send each shard its share at once and let them work
+    concurrently. Large batches are passed to the workers through shared
+    memory.
+
+    The workers are stopped by `close`, on leaving a `with` block, or when
+    the ShardedTrie is garbage collected.
+    """
+    PARTITIONS = ('hash', 'char')
+
+    def __init__(self, shards: int | None = None, partition: str = 'hash'):
+        shards = shards or os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError('shards must be positive!')
+        if partition not in self.PARTITIONS:
+            raise ValueError(f'partition must be one of {", ".join(self.PARTITIONS)}!')
+
+        self.shards = shards
+        self.partition = partition
+        self._connections = []
+        processes = []
+        # Started before the workers so they share it; otherwise a shared
+        # memory block created by one process and freed by another would
+        # be reported as leaked.
+        resource_tracker.ensure_running()
+        for _ in range(shards):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve_shard, args=(worker_connection,), daemon=True)
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            processes.append(process)
+        self._finalizer = weakref.finalize(self, _shutdown, self._connections, processes)
+
+    def close(self):
+        """Stops the worker processes, discarding their words."""
+        self._finalizer()
+
+    def __enter__(self) -> ShardedTrie:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def shard_of(self, word: str) -> int:
+        """Returns the index of the shard that owns the given word."""
+        if self.partition == 'char':
+            return ord(word[0]) % self.shards if word else 0
+        return zlib.crc32(word.encode('utf-8', 'surrogatepass')) % self.shards
+
+    def insert(self, word: str):
+        """Inserts a new word into the Trie."""
+        self.insert_batch((word,))
+
+    def search(self, word: str) -> bool:
+        """Returns whether or not a given word exists in the Trie."""
+        return self.search_batch((word,))[0]
+
+    def delete(self, word: str):
+        """Deletes a given word from the Trie, if it exists."""
+        self.delete_batch((word,))
+
+    def insert_batch(self, words: Iterable[str]):
+        """Inserts every word from the given iterable."""
+        self._route('insert', words)
+
+    def search_batch(self, words: Iterable[str]) -> list[bool]:
+        """Returns whether or not each of the given words exists in the Trie."""
+        return self._route('search', words)
+
+    def delete_batch(self, words: Iterable[str]):
+        """Deletes each of the given words from the Trie, if it exists."""
+        self._route('delete', words)
+
+    def longest_prefix(self, word: str) -> str | None:
+        """Returns the longest prefix of the given word, if one exists."""
+        prefixes = self._fan_out(word, ('longest_prefix', word))
+        return max(filter(None, prefixes), key=len, default=None)
+
+    def iter_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """
+        Returns the words that start with the given prefix, in lexicographic
+        order, stopping after `limit` words if one is given.
+        """
+        if limit == 0:
+            return []
+        words = heapq.merge(*self._fan_out(prefix, ('iter_prefix', prefix, limit)))
+        return list(itertools.islice(words, limit))
+
+    def _fan_out(self, prefix: str, message: tuple) -> list:
+        """
+        Sends a query to every shard that may hold words starting with the
+        given prefix, returning their answers.
+        """
+        if self.partition == 'char' and prefix:
+            return [self._request({self.shard_of(prefix): message})[self.shard_of(prefix)]]
+        return list(self._request(dict.fromkeys(range(self.shards), message)).values())
+
+    def _route(self, operation: str, words: Iterable[str]) -> list:
+        """
+        Sends each word to the shard that owns it, returning the shards'
+        results for the words in their original order.
+        """
+        positions = [[] for _ in range(self.shards)]
+        batches = [[] for _ in range(self.shards)]
+        for position, word in enumerate(words):
+            shard = self.shard_of(word)
+            positions[shard].append(position)
+            batches[shard].append(word)
+
+        answers = self._request({
+            shard: (operation, batch) for shard, batch in enumerate(batches) if batch})
+        results = [None] * sum(map(len, batches))
+        for shard, answer in answers.items():
+            for position, result in zip(positions[shard], answer or ()):
+                results[position] = result
+        return results
+
+    def _request(self, messages: dict[int, tuple]) -> dict:
+        """
+        Sends each shard its message, then waits for all of their answers,
+        so the shards work on them at the same time.
+        """
+        if not self._finalizer.alive:
+            raise ValueError('ShardedTrie is closed!')
+        for shard, message in messages.items():
+            _send(self._connections[shard], message)
+
+        answers = {}
+        error = None
+        for shard in messages:
+            is_error, answer = _receive(self._connections[shard])
+            if is_error:
+                error = error or answer
+            answers[shard] = answer
+        if error is not None:
+            raise error
+        return answers
+
+def shortest_unique_prefix(trie: ShardedTrie) -> list[str]:
+    """
+    Returns a list of the shortest unique prefixes in the ShardedTrie, in
+    lexicographic order.
+    """
+    if trie.partition == 'char':
+        # Each first character's whole subtree lives on a single shard.
+        answers = trie._request(dict.fromkeys(range(trie.shards), ('shortest_unique_prefix',)))
+        return sorted(prefix for prefixes in answers.values() for prefix in prefixes)
+
+    # A node's count is split across the shards holding the words below
+    # it, so the Trie is explored one level at a time: every shard reports
+    # the counts of the children of the prefixes still being extended, and
+    # the totals decide which are unique and which to extend further.
+    prefixes = []
+    frontier = ['']
+    while frontier:
+        answers = trie._request(dict.fromkeys(range(trie.shards), ('child_counts', frontier)))
+        totals = {}
+        for counts in answers.values():
+            for prefix, count in counts.items():
+                totals[prefix] = totals.get(prefix, 0) + count
+
+        frontier = []
+        for prefix, count in totals.items():
+            if count == 1:
+                prefixes.append(prefix)
+            else:
+                frontier.append(prefix)
+
+    prefixes.sort()
+    return prefixes
+
+def _serve_shard(connection):
+    """Runs in each worker process, answering requests against its own Trie."""
+    trie = Trie()
+    while True:
+        operation, *args = _receive(connection)
+        if operation == 'close':
+            break
+        try:
+            _send(connection, (False, _answer(trie, operation, *args)))
+        except Exception as error:
+            _send(connection, (True, error))
+    connection.close()
+
+def _answer(trie: Trie, operation: str, *args):
+    """Carries out one request against a shard's Trie."""
+    if operation == 'insert':
+        # Each shard has a process to itself, so pausing the collector
+        # affects nothing else.
+        trie.bulk_insert(args[0], pause_gc=True)
+    elif operation == 'search':
+        return [trie.search(word) for word in args[0]]
+    elif operation == 'delete':
+        for word in args[0]:
+            trie.delete(word)
+    elif operation == 'longest_prefix':
+        return trie.longest_prefix(args[0])
+    elif operation == 'iter_prefix':
+        return list(trie.iter_prefix(*args))
+    elif operation == 'shortest_unique_prefix':
+        return _shortest_unique_prefix(trie)
+    elif operation == 'child_counts':
+        counts = {}
+        for prefix in args[0]:
+            node = trie.get_leaf(prefix)
+            if node is not None:
+                for character, child in node.children.items():
+                    counts[prefix + character] = child.count
+        return counts
+    else:
+        raise ValueError(f'unknown operation {operation}!')
+
+def _send(connection, message):
+    """
+    Sends a message through the pipe, or through a new shared memory block
+    if it is large, in which case the receiver frees the block.
+    """
+    payload = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    if len(payload) < _SHARED_MEMORY_THRESHOLD:
+        connection.send_bytes(b'P' + payload)
+        return
+
+    block = shared_memory.SharedMemory(create=True, size=len(payload))
+    block.buf[:len(payload)] = payload
+    connection.send_bytes(b'S' + pickle.dumps((block.name, len(payload))))
+    block.close()
+
+def _receive(connection):
+    """Receives a message sent with `_send`."""
+    data = connection.recv_bytes()
+    if data[:1] == b'P':
+        return pickle.loads(memoryview(data)[1:])
+
+    name, size = pickle.loads(memoryview(data)[1:])
+    block = shared_memory.SharedMemory(name=name)
+    payload = block.buf[:size]
+    try:
+        return pickle.loads(payload)
+    finally:
+        payload.release()
+        block.close()
+        block.unlink()
+
+def _shutdown(connections: list, processes: list):
+    """Asks the workers to exit, and stops any that do not."""
+    for connection in connections:
+        try:
+            _send(connection, ('close',))
+        except OSError:
+            pass
+        connection.close()
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
@@ -0,0 +1,71 @@
+from .sharded_trie import ShardedTrie, shortest_unique_prefix
+from .trie import Trie, shortest_unique_prefix as trie_shortest_unique_prefix
+import random
+import string
+import unittest
+
+WORDS = ['dog', 'dove', 'duck', 'duck', 'do', 'zebra', 'zoo', 'hello', 'help', 'helloworld']
+
+class TestShardedTrie(unittest.TestCase):
+    def test_matches_trie(self):
+        expected = Trie()
+        expected.bulk_insert(WORDS)
+        for partition in ShardedTrie.PARTITIONS:
+            with ShardedTrie(3, partition) as trie:
+                trie.insert_batch(WORDS)
+                trie.insert('hex')
+                expected.insert('hex')
+                self.assertListEqual(
+                    [expected.search(word) for word in WORDS + ['he', 'hex', 'x']],
+                    trie.search_batch(WORDS + ['he', 'hex', 'x']))
+                self.assertListEqual(list(expected.iter_prefix('')), trie.iter_prefix(''))
+                self.assertListEqual(list(expected.iter_prefix('d', 3)), trie.iter_prefix('d', 3))
+                self.assertListEqual([], trie.iter_prefix('q'))
+                self.assertEqual('helloworld', trie.longest_prefix('helloworlds'))
+                self.assertEqual('do', trie.longest_prefix('dot'))
+                self.assertIsNone(trie.longest_prefix('cat'))
+                self.assertListEqual(
+                    sorted(trie_shortest_unique_prefix(expected)), shortest_unique_prefix(trie))
+                expected.delete('hex')
+
+    def test_delete(self):
+        with ShardedTrie(2) as trie:
+            trie.insert_batch(['hello', 'help', 'hello'])
+            trie.delete('hello')
+            trie.delete('missing')
+            self.assertFalse(trie.search('hello'))
+            self.assertTrue(trie.search('help'))
+            self.assertListEqual(['h'], shortest_unique_prefix(trie))
+
+    def test_large_batches(self):
+        rng = random.Random(0)
+        words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12))) for _ in range(20000)]
+        expected = Trie()
+        expected.bulk_insert(words)
+        with ShardedTrie(2) as trie:
+            trie.insert_batch(words)
+            self.assertTrue(all(trie.search_batch(words)))
+            self.assertListEqual(list(expected.iter_prefix('')), trie.iter_prefix(''))
+            self.assertListEqual(sorted(trie_shortest_unique_prefix(expected)), shortest_unique_prefix(trie))
+
+    def test_shard_of(self):
+        with ShardedTrie(4, 'char') as trie:
+            self.assertEqual(trie.shard_of('apple'), trie.shard_of('avocado'))
+            self.assertEqual(0, trie.shard_of(''))
+            self.assertTrue(all(0 <= trie.shard_of(word) < 4 for word in WORDS))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ShardedTrie(2, 'range')
+        trie = ShardedTrie(1)
+        with self.assertRaises(TypeError):
+            trie._request({0: ('search', [None])})
+        self.assertListEqual([], trie.search_batch([]))
+        trie.insert('still works')
+        self.assertTrue(trie.search('still works'))
+        trie.close()
+        with self.assertRaises(ValueError):
+            trie.search('hello')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import Callable
+import gc
+import heapq
+import itertools
+from typing import Callable, Iterable, Iterator
 
 class TrieNode:
     def __init__(self, character='', count=1):
@@ -7,6 +10,9 @@ class TrieNode:
         self.children = {}
         self.is_terminal = False
         self.count = count
+        # The best words below this node, cached by `Trie.top_k` as
+        # (k, entries), and cleared whenever a word below it changes.
+        self.top_words = None
     
     def add_child(self, node: TrieNode):
         """Adds a node to the collection of children."""
@@ -24,6 +30,13 @@ class Trie:
     def __init__(self):
         self.root = TrieNode(count=0)
 
+    @classmethod
+    def from_sorted(cls, words: Iterable[str]) -> Trie:
+        """Builds a Trie from an iterable of words in ascending order."""
+        trie = cls()
+        trie.bulk_insert(words)
+        return trie
+
     def search(self, word: str) -> bool:
         """Returns whether or not a given word exists in the Trie."""
         leaf = self.get_leaf(word)
@@ -31,71 +44,214 @@ class Trie:
 
     def insert(self, word: str):
         """Inserts a new word into the Trie."""
-        def callback(character, current):
-            child = current.get_child_with(character)
-            if child:
+        current = self.root
+        current.top_words = None
+        for character in word:
+            child = current.children.get(character)
+            if child is None:
+                child = TrieNode(character)
+                current.children[character] = child
+            else:
                 child.count += 1
-                return child
-            new_node = TrieNode(character)
-            current.add_child(new_node)
-            return new_node
-        
-        leaf = self._traverse_word(word, callback)
-        leaf.is_terminal = True
+                child.top_words = None
+            current = child
+
+        current.is_terminal = True
+
+    def bulk_insert(self, words: Iterable[str], pause_gc: bool = False):
+        """
+        Inserts every word from the given iterable into the Trie, leaving it
+        in the same state as calling `insert` on each word would. If the
+        iterable raises, the words before it are fully inserted.
+
+        The words are consumed in a single streaming pass. Any order works,
+        but sorted input is fastest, since the path shared with the previous
+        word is reused rather than walked again from the root.
+
+        Nodes never form reference cycles, so `pause_gc` can be set to turn
+        off the cyclic garbage collector during the load and save its
+        repeated scans of the new nodes. The collector is global, so this
+        pauses it for every thread in the process until the load finishes.
+        """
+        if not pause_gc:
+            self._bulk_insert(words)
+            return
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._bulk_insert(words)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _bulk_insert(self, words: Iterable[str]):
+        """Helper method containing the streaming pass of `bulk_insert`."""
+        # The path to the previous word, along with how many words had been
+        # seen when each node was entered. A node's count is only settled
+        # once it leaves the path, by adding the number of words that passed
+        # through it in the meantime.
+        path = []
+        entered = []
+        previous = ''
+        seen = 0
+        self.root.top_words = None
+
+        try:
+            for word in words:
+                shared = 0
+                limit = min(len(word), len(path))
+                while shared < limit and word[shared] == previous[shared]:
+                    shared += 1
+
+                while len(path) > shared:
+                    path.pop().count += seen - entered.pop()
+
+                current = path[-1] if path else self.root
+                for character in word[shared:]:
+                    child = current.children.get(character)
+                    if child is None:
+                        child = TrieNode(character, count=0)
+                        current.children[character] = child
+                    child.top_words = None
+                    path.append(child)
+                    entered.append(seen)
+                    current = child
+
+                current.is_terminal = True
+                previous = word
+                seen += 1
+        finally:
+            # Settling the rest of the path also keeps the counts right for
+            # the words inserted before an iterable that raises.
+            while path:
+                path.pop().count += seen - entered.pop()
 
     def delete(self, word: str):
-        """Deletes a given word from the Trie."""
-        stack = []
+        """Deletes a given word from the Trie, if it exists."""
+        leaf = self.get_leaf(word)
+        if leaf is None or not leaf.is_terminal:
+            return
+
+        # Every insertion of the word added one to the count of each node on
+        # its path, so those counts are reduced by the number of times it was
+        # inserted. Nodes shared with other words keep a positive count; the
+        # first node whose count drops to zero starts a branch that belonged
+        # only to this word, so it can be removed along with its descendants.
+        occurrences = leaf.count - sum(child.count for child in leaf.children.values())
+        leaf.is_terminal = False
+
+        parent = self.root
+        parent.top_words = None
+        for character in word:
+            node = parent.children[character]
+            node.count -= occurrences
+            if node.count == 0:
+                del parent.children[character]
+                break
+            node.top_words = None
+            parent = node
+
+    def iter_prefix(self, prefix: str, limit: int | None = None) -> Iterator[str]:
+        """
+        Lazily yields the words that start with the given prefix, in
+        lexicographic order, stopping after `limit` words if one is given.
+        """
+        node = self.get_leaf(prefix)
+        if node is None or limit == 0:
+            return
+
+        yielded = 0
+        characters = list(prefix)
+        stack = [(node, len(prefix))]
+        while stack:
+            node, depth = stack.pop()
+            if depth > len(prefix):
+                del characters[depth - 1:]
+                characters.append(node.character)
+
+            if node.is_terminal:
+                yield ''.join(characters)
+                yielded += 1
+                if yielded == limit:
+                    return
+
+            for character in sorted(node.children, reverse=True):
+                stack.append((node.children[character], depth + 1))
+
+    def top_k(self, prefix: str, k: int) -> list[tuple[str, int]]:
+        """
+        Returns up to `k` words that start with the given prefix, paired with
+        the number of times they were inserted, most frequent first. Words
+        with the same frequency are ordered lexicographically.
+        """
+        node = self.get_leaf(prefix)
+        if node is None or k <= 0:
+            return []
+
+        return [(word, -negative_frequency) for negative_frequency, word in _top_words(node, prefix, k)[:k]]
+
+    def search_fuzzy(self, word: str, max_distance: int) -> list[tuple[str, int]]:
+        """
+        Returns every word within the given Levenshtein distance of the given
+        word, paired with its distance, closest first and then in
+        lexicographic order.
+        """
+        # Each node extends its parent's row of the edit distance table by
+        # one character. Once every entry in a row exceeds the limit, no
+        # word below that node can come back within it.
+        columns = len(word) + 1
+        first_row = list(range(columns))
+        results = []
+        if self.root.is_terminal and first_row[-1] <= max_distance:
+            results.append(('', first_row[-1]))
+
+        stack = [(child, character, first_row) for character, child in self.root.children.items()]
+        while stack:
+            node, prefix, previous_row = stack.pop()
+            character = node.character
+            row = [previous_row[0] + 1]
+            for column in range(1, columns):
+                row.append(min(
+                    row[column - 1] + 1,
+                    previous_row[column] + 1,
+                    previous_row[column - 1] + (word[column - 1] != character)))
+
+            if node.is_terminal and row[-1] <= max_distance:
+                results.append((prefix, row[-1]))
+            if min(row) <= max_distance:
+                for character, child in node.children.items():
+                    stack.append((child, prefix + character, row))
+
+        results.sort(key=lambda result: (result[1], result[0]))
+        return results
 
-        def callback(character, current):
-            # If we end up deleting a word that has a prefix present in the Trie,
-            # we need to preserve that prefix. So we clear the stack of nodes to
-            # delete whenever we encounter a terminal node.
-            if current.is_terminal:
-                stack.clear()
-            stack.append(current)
-            return current.get_child_with(character)
-        
-        leaf = self._traverse_word(word, callback)
-
-        # If the last node in the word has children, that means that a longer
-        # word exists in the Trie with the word we are deleting as a prefix.
-        # In this case, we do not want to actually delete the nodes.
-        if leaf.has_children():
-            leaf.is_terminal = False
-        else:
-            i = len(word) - 1
-            while i >= 0 and len(stack) > 0:
-                parent = stack.pop()
-                del parent.children[word[i]]
-                i -= 1
-    
     def get_leaf(self, word: str) -> TrieNode | None:
         """Returns the leaf node of the given word in the Trie, if it exists."""
-        return self._traverse_word(
-            word,
-            lambda character, current: current.get_child_with(character))
+        current = self.root
+        for character in word:
+            current = current.children.get(character)
+            if current is None:
+                return None
+
+        return current
 
     def longest_prefix(self, word: str) -> str:
         """Returns the longest prefix of the given word, if one exists."""
         current = self.root
-        prefix = ""
-        last_terminal = -1
+        length = 0
 
-        for idx, character in enumerate(word):
-            child = current.get_child_with(character)
-            if not child:
+        for idx, character in enumerate(word, 1):
+            current = current.children.get(character)
+            if current is None:
                 break
-            if child.is_terminal:
-                last_terminal = idx
-            
-            prefix += character
-            current = child
-        
-        if last_terminal == -1:
+            if current.is_terminal:
+                length = idx
+
+        if length == 0:
             return None
 
-        return prefix[:last_terminal + 1]
+        return word[:length]
 
     def _traverse_word(self, word: str, callback: function) -> TrieNode | None:
         """
@@ -110,18 +266,83 @@ class Trie:
 
         return current
 
+def _top_words(node: TrieNode, prefix: str, k: int) -> list[tuple[int, str]]:
+    """
+    Returns at least the best `k` words below the node, whose path spells
+    the given prefix, if it has that many, as (-frequency, word) pairs in
+    order.
+
+    Every node keeps the best words below it from the last time they were
+    needed, and changing a word clears only the nodes on its path. Only
+    those nodes are rebuilt, each by merging the first `k` entries of its
+    children's lists, so after a write a query costs O(k) per node along
+    the changed paths, however large the subtree is.
+    """
+    def is_stale(node: TrieNode) -> bool:
+        # Lists cut short at fewer than `k` words are not enough; lists
+        # holding every word below the node always are.
+        top_words = node.top_words
+        return top_words is None or len(top_words[1]) == top_words[0] < k
+
+    if not is_stale(node):
+        return node.top_words[1]
+
+    # Post-order, with the characters of the current path kept in a buffer
+    # as in `iter_prefix`. When a node is finished only its descendants
+    # have been visited since it was entered, so the buffer up to its depth
+    # still spells its path.
+    characters = list(prefix)
+    stack = [(node, len(prefix), False)]
+    while stack:
+        current, depth, children_ready = stack.pop()
+        children = current.children
+        if not children_ready:
+            if depth > len(prefix):
+                del characters[depth - 1:]
+                characters.append(current.character)
+            if not children:
+                words = [(-max(current.count, 1), ''.join(characters))] if current.is_terminal else []
+                current.top_words = (k, words)
+                continue
+            stack.append((current, depth, True))
+            for child in children.values():
+                if is_stale(child):
+                    stack.append((child, depth + 1, False))
+            continue
+
+        if not current.is_terminal and len(children) == 1:
+            # Nodes along a chain hold exactly the same words as their child.
+            for child in children.values():
+                current.top_words = child.top_words
+            continue
+
+        own = []
+        if current.is_terminal:
+            frequency = current.count - sum(child.count for child in children.values())
+            own.append((-max(frequency, 1), ''.join(characters[:depth])))
+        merged = heapq.merge(own, *[child.top_words[1] for child in children.values()])
+        current.top_words = (k, list(itertools.islice(merged, k)))
+
+    return node.top_words[1]
+
 def shortest_unique_prefix(trie: Trie) -> list[str]:
     """Returns a list of the shortest unique prefixes in the Trie."""
     prefixes = []
 
-    def dfs(node: TrieNode, running_string: str):
-        new_string = running_string + node.character
+    # Depth-first, visiting children in insertion order, with the characters
+    # of the current path kept in one buffer that is trimmed on the way back
+    # up instead of building a new string for every node.
+    characters = []
+    stack = [(trie.root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        del characters[depth:]
+        characters.append(node.character)
         if node.count == 1:
-            prefixes.append(new_string)
-            return
+            prefixes.append(''.join(characters))
+            continue
 
-        for child in node.children.values():
-            dfs(child, new_string)
+        for child in reversed(node.children.values()):
+            stack.append((child, depth + 1))
 
-    dfs(trie.root, "")
     return prefixes
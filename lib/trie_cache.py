@@ -0,0 +1,135 @@
+from __future__ import annotations
+import bisect
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable
+from .trie import Trie, TrieNode
+
+class CachedTrie:
+    """
+    A Trie with a bounded cache in front of `search`, `longest_prefix` and
+    `get_leaf`, for workloads where a few words make up most queries.
+
+    Results are evicted least recently used first once more than `maxsize`
+    are held, and, if `ttl` is given, once they are that many seconds old.
+    Inserting or deleting a word through the CachedTrie invalidates exactly
+    the results it can change: `search` of the word itself, `get_leaf` of
+    its prefixes, and `longest_prefix` of words it is a prefix of. The Trie
+    must not be modified other than through the CachedTrie. Nodes returned
+    by `get_leaf` belong to the Trie and must not be modified either.
+    """
+    def __init__(self, trie: Trie, maxsize: int = 1024, ttl: float | None = None,
+            clock: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive!')
+
+        self.trie = trie
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Maps (operation, word) to (result, expiry time). The words with a
+        # cached `longest_prefix` are also kept sorted, so those starting
+        # with a changed word form one run that can be found by bisection.
+        self._cache = OrderedDict()
+        self._longest_prefix_words = []
+
+    def search(self, word: str) -> bool:
+        """Returns whether or not a given word exists in the Trie."""
+        return self._lookup('search', word)
+
+    def longest_prefix(self, word: str) -> str | None:
+        """Returns the longest prefix of the given word, if one exists."""
+        return self._lookup('longest_prefix', word)
+
+    def get_leaf(self, word: str) -> TrieNode | None:
+        """Returns the leaf node of the given word in the Trie, if it exists."""
+        return self._lookup('get_leaf', word)
+
+    def insert(self, word: str):
+        """Inserts a new word into the Trie."""
+        self.trie.insert(word)
+        self._invalidate(word)
+
+    def bulk_insert(self, words: Iterable[str]):
+        """Inserts every word from the given iterable into the Trie."""
+        words = list(words)
+        self.trie.bulk_insert(words)
+        for word in words:
+            self._invalidate(word)
+
+    def delete(self, word: str):
+        """Deletes a given word from the Trie, if it exists."""
+        self.trie.delete(word)
+        self._invalidate(word)
+
+    def clear(self):
+        """Empties the cache, keeping the counters."""
+        self._cache.clear()
+        self._longest_prefix_words.clear()
+
+    def stats(self) -> dict:
+        """Returns the cache's counters, how many results it holds and its hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'cached': len(self._cache),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def _lookup(self, operation: str, word: str):
+        """Returns the cached result of the operation, computing it on a miss."""
+        key = (operation, word)
+        entry = self._cache.get(key)
+        if entry is not None:
+            result, expires = entry
+            if expires is None or self.clock() < expires:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return result
+            self._remove(key)
+            self.evictions += 1
+
+        self.misses += 1
+        result = getattr(self.trie, operation)(word)
+        self._cache[key] = (result, None if self.ttl is None else self.clock() + self.ttl)
+        if operation == 'longest_prefix':
+            bisect.insort(self._longest_prefix_words, word)
+        if len(self._cache) > self.maxsize:
+            self._remove(next(iter(self._cache)))
+            self.evictions += 1
+        return result
+
+    def _invalidate(self, word: str):
+        """Drops the cached results that inserting or deleting the word can change."""
+        # The word's own results, and `get_leaf` of each prefix, whose node
+        # may have been created or removed.
+        stale = [('get_leaf', word[:idx]) for idx in range(len(word) + 1)]
+        stale.append(('search', word))
+
+        # `longest_prefix` of the word and every word it is a prefix of,
+        # since the word may have become or stopped being a prefix of them.
+        words = self._longest_prefix_words
+        idx = bisect.bisect_left(words, word)
+        while idx < len(words) and words[idx].startswith(word):
+            stale.append(('longest_prefix', words[idx]))
+            idx += 1
+
+        for key in stale:
+            if key in self._cache:
+                self._remove(key)
+                self.invalidations += 1
+
+    def _remove(self, key: tuple[str, str]):
+        """Removes a cached result."""
+        del self._cache[key]
+        operation, word = key
+        if operation == 'longest_prefix':
+            words = self._longest_prefix_words
+            del words[bisect.bisect_left(words, word)]
@@ -0,0 +1,119 @@
+from .trie import Trie
+from .trie_cache import CachedTrie
+import random
+import unittest
+
+def _cached_trie(**options):
+    trie = Trie()
+    trie.bulk_insert(['hello', 'help', 'helloworld'])
+    return CachedTrie(trie, **options)
+
+class TestCachedTrie(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = _cached_trie()
+        self.assertTrue(cache.search('hello'))
+        self.assertTrue(cache.search('hello'))
+        self.assertEqual('hello', cache.longest_prefix('hellothere'))
+        self.assertIs(cache.trie.get_leaf('hel'), cache.get_leaf('hel'))
+        self.assertIsNone(cache.get_leaf('x'))
+        self.assertIsNone(cache.get_leaf('x'))
+        stats = cache.stats()
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(4, stats['misses'])
+        self.assertEqual(4, stats['cached'])
+        self.assertAlmostEqual(2 / 6, stats['hit_rate'])
+
+    def test_lru_eviction(self):
+        cache = _cached_trie(maxsize=2)
+        cache.search('hello')
+        cache.search('help')
+        cache.search('hello')
+        cache.search('helloworld')
+        self.assertEqual(1, cache.evictions)
+        cache.search('hello')
+        self.assertEqual(2, cache.hits)
+        cache.search('help')
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(2, cache.stats()['cached'])
+
+    def test_ttl(self):
+        now = [0.0]
+        cache = _cached_trie(ttl=10, clock=lambda: now[0])
+        cache.search('hello')
+        now[0] = 5
+        cache.search('hello')
+        now[0] = 11
+        cache.search('hello')
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(1, cache.evictions)
+
+    def test_insert_invalidates(self):
+        cache = _cached_trie()
+        self.assertFalse(cache.search('he'))
+        self.assertIsNone(cache.get_leaf('hex'))
+        self.assertEqual('hello', cache.longest_prefix('hellos'))
+        self.assertEqual('help', cache.longest_prefix('helpful'))
+        self.assertTrue(cache.search('help'))
+
+        cache.insert('hexagon')
+        self.assertEqual(1, cache.invalidations)
+        self.assertIsNotNone(cache.get_leaf('hex'))
+        cache.insert('hellos')
+        self.assertEqual(2, cache.invalidations)
+        self.assertEqual('hellos', cache.longest_prefix('hellos'))
+        cache.insert('he')
+        self.assertEqual(5, cache.invalidations)
+        self.assertTrue(cache.search('he'))
+        self.assertEqual('help', cache.longest_prefix('helpful'))
+        self.assertTrue(cache.search('help'))
+        self.assertEqual(1, cache.hits)
+
+    def test_delete_invalidates(self):
+        cache = _cached_trie()
+        self.assertTrue(cache.search('hello'))
+        self.assertEqual('hello', cache.longest_prefix('hellothere'))
+        self.assertIsNotNone(cache.get_leaf('helloworld'))
+        self.assertIsNotNone(cache.get_leaf('hellow'))
+        cache.delete('helloworld')
+        self.assertIsNone(cache.get_leaf('helloworld'))
+        self.assertIsNone(cache.get_leaf('hellow'))
+        self.assertEqual('hello', cache.longest_prefix('hellothere'))
+        self.assertTrue(cache.search('hello'))
+        cache.delete('hello')
+        self.assertFalse(cache.search('hello'))
+        self.assertIsNone(cache.longest_prefix('hellothere'))
+
+    def test_matches_trie(self):
+        rng = random.Random(0)
+        expected = Trie()
+        cache = CachedTrie(Trie(), maxsize=50)
+        words = [''.join(rng.choices('abc', k=rng.randint(0, 4))) for _ in range(40)]
+        for _ in range(3000):
+            word = rng.choice(words)
+            action = rng.random()
+            if action < 0.1:
+                expected.insert(word)
+                cache.insert(word)
+            elif action < 0.15:
+                expected.delete(word)
+                cache.delete(word)
+            else:
+                self.assertEqual(expected.search(word), cache.search(word))
+                self.assertEqual(expected.longest_prefix(word), cache.longest_prefix(word))
+                self.assertEqual(expected.get_leaf(word) is None, cache.get_leaf(word) is None)
+        self.assertGreater(cache.hits, 0)
+        self.assertGreater(cache.invalidations, 0)
+
+    def test_clear(self):
+        cache = _cached_trie()
+        cache.search('hello')
+        cache.clear()
+        cache.search('hello')
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(1, cache.stats()['cached'])
+        with self.assertRaises(ValueError):
+            CachedTrie(Trie(), maxsize=0)
+
+if __name__ == '__main__':
+    unittest.main()
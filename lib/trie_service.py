@@ -0,0 +1,163 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from .trie import Trie
+
+class TrieService:
+    """
+    An asyncio front end to a Trie that gathers concurrent lookups into
+    batches. Queries arriving within `window` seconds of the first one
+    waiting are answered together in a single call, either on the event
+    loop, in a thread of the given executor, or in one of `processes`
+    worker processes. A batch is sent as soon as it holds `max_batch`
+    queries. With the default window of zero, a batch holds the queries
+    made during one iteration of the event loop, so batching adds no delay
+    of its own.
+
+    At most `max_pending` queries can be waiting or running at once; any
+    more wait for earlier ones to finish before they are queued.
+
+    With a thread executor, the Trie is read from the worker while the
+    event loop carries on, so it should not be modified meanwhile unless
+    it is a `SnapshotTrie`. With worker processes, each process builds its
+    own copy of the Trie's words once, when it starts, and only the
+    queries and results are sent for each batch. Changes made to the Trie
+    afterwards are not seen by the workers. The processes are shut down by
+    `close`.
+    """
+    def __init__(self, trie: Trie, window: float = 0, max_batch: int = 256,
+            max_pending: int = 1024, executor: Executor | None = None, processes: int | None = None):
+        if max_batch < 1 or max_pending < 1:
+            raise ValueError('max_batch and max_pending must be positive!')
+        if isinstance(executor, ProcessPoolExecutor):
+            raise ValueError('pass processes rather than a process executor, so the Trie is only sent once!')
+        if executor is not None and processes is not None:
+            raise ValueError('executor and processes cannot both be given!')
+        if processes is not None:
+            # The words are sent rather than the Trie itself, since pickling
+            # the nested nodes of long words exceeds the recursion limit.
+            executor = ProcessPoolExecutor(
+                processes, initializer=_load_worker_trie, initargs=(list(trie.iter_prefix('')),))
+
+        self.trie = trie
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = executor
+        self._owns_executor = processes is not None
+        self.batches = 0
+        self.queries = 0
+        self._slots = asyncio.Semaphore(max_pending)
+        self._pending = []
+        self._timer = None
+        self._running = set()
+
+    async def search(self, word: str) -> bool:
+        """Returns whether or not a given word exists in the Trie."""
+        return await self._submit('search', word, None)
+
+    async def longest_prefix(self, word: str) -> str | None:
+        """Returns the longest prefix of the given word in the Trie, if one exists."""
+        return await self._submit('longest_prefix', word, None)
+
+    async def complete(self, prefix: str, limit: int | None = 10) -> list[str]:
+        """Returns up to `limit` words that start with the given prefix, in lexicographic order."""
+        return await self._submit('complete', prefix, limit)
+
+    async def close(self):
+        """Sends any waiting queries and waits for every batch to finish."""
+        if self._pending:
+            self._flush()
+        while self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        if self._owns_executor:
+            # Waiting for the worker processes to exit blocks, so it is done
+            # in a thread rather than on the event loop.
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    async def __aenter__(self) -> TrieService:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _submit(self, operation: str, word: str, limit: int | None):
+        """Queues a query and waits for the batch holding it to be answered."""
+        async with self._slots:
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((operation, word, limit, future))
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+            return await future
+
+    def _flush(self):
+        """Answers the waiting queries as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending
+        self._pending = []
+        self.batches += 1
+        self.queries += len(batch)
+        queries = [(operation, word, limit) for operation, word, limit, _ in batch]
+        futures = [future for *_, future in batch]
+
+        if self.executor is None:
+            _resolve(futures, _run_batch(self.trie, queries))
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_in_executor(futures, queries))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_in_executor(self, futures: list[asyncio.Future], queries: list[tuple]):
+        """Answers a batch in the executor."""
+        loop = asyncio.get_running_loop()
+        try:
+            trie = None if self._owns_executor else self.trie
+            results = await loop.run_in_executor(self.executor, _run_batch, trie, queries)
+        except Exception as error:
+            results = [error] * len(futures)
+        _resolve(futures, results)
+
+# The copy of the Trie held by each worker process.
+_worker_trie = None
+
+def _load_worker_trie(words: list[str]):
+    """Builds a worker process's copy of the Trie when the process starts."""
+    global _worker_trie
+    _worker_trie = Trie.from_sorted(words)
+
+def _run_batch(trie: Trie | None, queries: list[tuple[str, str, int | None]]) -> list:
+    """
+    Answers each (operation, word, limit) query in turn, returning the
+    results in the same order. A query that raises has the exception put in
+    place of its result, so the rest of the batch is unaffected. Worker
+    processes pass no Trie, and use their own copy.
+    """
+    if trie is None:
+        trie = _worker_trie
+    results = []
+    for operation, word, limit in queries:
+        try:
+            if operation == 'search':
+                results.append(trie.search(word))
+            elif operation == 'longest_prefix':
+                results.append(trie.longest_prefix(word))
+            else:
+                results.append(list(trie.iter_prefix(word, limit)))
+        except Exception as error:
+            results.append(error)
+    return results
+
+def _resolve(futures: list[asyncio.Future], results: list):
+    """Sets each future's result, skipping any that were cancelled while waiting."""
+    for future, result in zip(futures, results):
+        if future.done():
+            continue
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
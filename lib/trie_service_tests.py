@@ -0,0 +1,91 @@
+from .trie import Trie
+from .trie_service import TrieService
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import unittest
+
+def _trie():
+    trie = Trie()
+    for word in ['hello', 'help', 'helloworld', 'world']:
+        trie.insert(word)
+    return trie
+
+class TestTrieService(unittest.IsolatedAsyncioTestCase):
+    async def test_queries(self):
+        async with TrieService(_trie()) as service:
+            self.assertTrue(await service.search('hello'))
+            self.assertFalse(await service.search('hell'))
+            self.assertEqual('hello', await service.longest_prefix('hellothere'))
+            self.assertIsNone(await service.longest_prefix('xyz'))
+            self.assertListEqual(['hello', 'helloworld'], await service.complete('hell', 2))
+
+    async def test_concurrent_queries_are_batched(self):
+        words = ['hello', 'hell', 'world', 'worlds'] * 25
+        async with TrieService(_trie(), window=0.01) as service:
+            results = await asyncio.gather(*(service.search(word) for word in words))
+        self.assertListEqual([word in ('hello', 'world') for word in words], results)
+        self.assertEqual(1, service.batches)
+        self.assertEqual(100, service.queries)
+
+    async def test_max_batch(self):
+        async with TrieService(_trie(), window=10, max_batch=8) as service:
+            results = await asyncio.gather(*(service.search('help') for _ in range(16)))
+            self.assertTrue(all(results))
+            self.assertEqual(2, service.batches)
+
+    async def test_max_pending(self):
+        service = TrieService(_trie(), window=0.01, max_pending=4)
+        tasks = [asyncio.create_task(service.search('help')) for _ in range(10)]
+        await asyncio.sleep(0)
+        self.assertEqual(4, len(service._pending))
+        self.assertTrue(all(await asyncio.gather(*tasks)))
+        self.assertEqual(3, service.batches)
+
+    async def test_errors_are_per_query(self):
+        async with TrieService(_trie(), window=0.01) as service:
+            results = await asyncio.gather(
+                service.search(None), service.search('help'), return_exceptions=True)
+        self.assertIsInstance(results[0], TypeError)
+        self.assertTrue(results[1])
+
+    async def test_thread_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+            async with TrieService(_trie(), executor=executor) as service:
+                results = await asyncio.gather(service.search('world'), service.complete('wor'))
+        self.assertListEqual([True, ['world']], results)
+
+    async def test_processes(self):
+        trie = _trie()
+        trie.insert('ab' * 1500)
+        async with TrieService(trie, processes=1) as service:
+            results = await asyncio.gather(
+                service.longest_prefix('helpful'), service.search('x'), service.search('ab' * 1500))
+            self.assertListEqual(['help', False, True], results)
+            self.assertListEqual(['hello', 'helloworld'], await service.complete('hello'))
+
+    async def test_close_does_not_block_loop(self):
+        ticks = 0
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        service = TrieService(_trie(), processes=1)
+        self.assertTrue(await service.search('world'))
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        ticks = 0
+        await service.close()
+        ticker.cancel()
+        self.assertGreater(ticks, 0)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            TrieService(_trie(), max_batch=0)
+        with ProcessPoolExecutor(1) as executor:
+            with self.assertRaises(ValueError):
+                TrieService(_trie(), executor=executor)
+
+if __name__ == '__main__':
+    unittest.main()
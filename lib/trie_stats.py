@@ -0,0 +1,196 @@
+from __future__ import annotations
+import sys
+import threading
+import time
+from .trie import Trie
+
+class TrieStats:
+    """
+    Records per-operation statistics for a single Trie: call counts, nodes
+    visited, nodes allocated and freed, and a latency histogram for each of
+    `search`, `insert`, `bulk_insert`, `delete` and `longest_prefix`.
+
+    Instrumentation works by shadowing those methods on the Trie instance
+    with recording wrappers, so Tries that are not instrumented, or have
+    been detached, run the plain class methods at no extra cost. Node
+    counts are gathered by walking each word outside the timed section, so
+    the latencies only cover the operation itself. Nodes that already
+    existed when the Trie was instrumented, such as those built by
+    `Trie.from_sorted`, are not counted as allocated.
+    """
+    OPERATIONS = ('search', 'insert', 'bulk_insert', 'delete', 'longest_prefix')
+
+    def __init__(self, trie: Trie):
+        self.trie = trie
+        # Set while an insert is being recorded, so that `bulk_insert` calls
+        # it makes itself, as `SnapshotTrie.insert` does, are not counted
+        # twice.
+        self._recording = threading.local()
+        self.reset()
+        for operation in self.OPERATIONS:
+            setattr(trie, operation, self._wrap(operation, getattr(trie, operation)))
+
+    def reset(self):
+        """Clears every counter and histogram."""
+        self.calls = dict.fromkeys(self.OPERATIONS, 0)
+        self.nodes_visited = dict.fromkeys(self.OPERATIONS, 0)
+        self.total_ns = dict.fromkeys(self.OPERATIONS, 0)
+        # Bucket `b` counts calls that took fewer than 2 ** b nanoseconds,
+        # and at least half that.
+        self.latency_buckets = {operation: [0] * 64 for operation in self.OPERATIONS}
+        self.nodes_allocated = 0
+        self.nodes_freed = 0
+
+    def detach(self):
+        """Removes the instrumentation, restoring the Trie's own methods."""
+        for operation in self.OPERATIONS:
+            vars(self.trie).pop(operation, None)
+
+    def snapshot(self, include_memory: bool = False) -> dict:
+        """
+        Returns the current statistics as plain, JSON-serializable data.
+        Latency histograms map the upper bound of each non-empty bucket, in
+        nanoseconds, to its count. Memory statistics walk the whole Trie, so
+        they are only included when asked for.
+        """
+        snapshot = {
+            'operations': {
+                operation: {
+                    'calls': self.calls[operation],
+                    'nodes_visited': self.nodes_visited[operation],
+                    'total_ns': self.total_ns[operation],
+                    'latency_ns': {
+                        1 << bucket: count
+                        for bucket, count in enumerate(self.latency_buckets[operation]) if count
+                    },
+                }
+                for operation in self.OPERATIONS
+            },
+            'nodes_allocated': self.nodes_allocated,
+            'nodes_freed': self.nodes_freed,
+        }
+        if include_memory:
+            snapshot['memory'] = memory_stats(self.trie)
+        return snapshot
+
+    def _wrap(self, operation: str, method):
+        """Returns a wrapper around the Trie method that records its statistics."""
+        trie = self.trie
+        if operation == 'bulk_insert':
+            return self._wrap_bulk_insert(method)
+
+        def record(word: str):
+            depth_before = _matched_depth(trie, word) if operation in ('insert', 'delete') else 0
+            began = time.perf_counter_ns()
+            result = method(word)
+            elapsed = time.perf_counter_ns() - began
+
+            # The counters are looked up on every call, since `reset`
+            # replaces them.
+            self.calls[operation] += 1
+            self.total_ns[operation] += elapsed
+            self.latency_buckets[operation][min(elapsed.bit_length(), 63)] += 1
+            if operation == 'insert':
+                self.nodes_visited[operation] += len(word)
+                self.nodes_allocated += len(word) - depth_before
+            elif operation == 'delete':
+                self.nodes_visited[operation] += depth_before
+                self.nodes_freed += depth_before - _matched_depth(trie, word)
+            else:
+                self.nodes_visited[operation] += _matched_depth(trie, word)
+            return result
+
+        if operation != 'insert':
+            record.__doc__ = method.__doc__
+            return record
+
+        def wrapper(word: str):
+            self._recording.active = True
+            try:
+                return record(word)
+            finally:
+                self._recording.active = False
+
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def _wrap_bulk_insert(self, method):
+        """
+        Returns a wrapper around `bulk_insert` that counts the nodes each
+        word adds as it is read from the iterable. Every earlier word has
+        been inserted by then, and the time spent counting is left out of
+        the latency. A `SnapshotTrie` only publishes the words at the end of
+        the call, so there the nodes they share with each other are counted
+        once for each word.
+        """
+        trie = self.trie
+
+        def wrapper(words, *args, **kwargs):
+            if getattr(self._recording, 'active', False):
+                return method(words, *args, **kwargs)
+
+            counting_ns = 0
+            def counted(words):
+                nonlocal counting_ns
+                for word in words:
+                    began = time.perf_counter_ns()
+                    self.nodes_visited['bulk_insert'] += len(word)
+                    self.nodes_allocated += len(word) - _matched_depth(trie, word)
+                    counting_ns += time.perf_counter_ns() - began
+                    yield word
+
+            self._recording.active = True
+            try:
+                began = time.perf_counter_ns()
+                result = method(counted(words), *args, **kwargs)
+                elapsed = time.perf_counter_ns() - began - counting_ns
+            finally:
+                self._recording.active = False
+
+            self.calls['bulk_insert'] += 1
+            self.total_ns['bulk_insert'] += elapsed
+            self.latency_buckets['bulk_insert'][min(max(elapsed, 0).bit_length(), 63)] += 1
+            return result
+
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+def instrument(trie: Trie) -> TrieStats:
+    """Starts recording statistics for the given Trie."""
+    return TrieStats(trie)
+
+def memory_stats(trie: Trie) -> dict:
+    """
+    Returns the number of nodes in the Trie, how many nodes there are at
+    each depth, and an estimate of the bytes they use, counting each node
+    object along with its attribute and children dicts.
+    """
+    node_count = 0
+    estimated_bytes = 0
+    depths = {}
+    stack = [(trie.root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        node_count += 1
+        depths[depth] = depths.get(depth, 0) + 1
+        estimated_bytes += sys.getsizeof(node) + sys.getsizeof(vars(node)) + sys.getsizeof(node.children)
+        for child in node.children.values():
+            stack.append((child, depth + 1))
+
+    return {
+        'node_count': node_count,
+        'max_depth': max(depths),
+        'depth_distribution': dict(sorted(depths.items())),
+        'estimated_bytes': estimated_bytes,
+    }
+
+def _matched_depth(trie: Trie, word: str) -> int:
+    """Returns how many characters of the word can be followed from the root."""
+    current = trie.root
+    depth = 0
+    for character in word:
+        current = current.children.get(character)
+        if current is None:
+            break
+        depth += 1
+    return depth
@@ -0,0 +1,106 @@
+from .concurrent_trie import SnapshotTrie
+from .trie import Trie
+from .trie_stats import instrument, memory_stats
+import json
+import unittest
+
+class TestTrieStats(unittest.TestCase):
+    def test_counters(self):
+        trie = Trie()
+        stats = instrument(trie)
+        trie.insert('hello')
+        trie.insert('help')
+        self.assertTrue(trie.search('hello'))
+        self.assertFalse(trie.search('hex'))
+        self.assertEqual('help', trie.longest_prefix('helpful'))
+        trie.delete('hello')
+
+        snapshot = stats.snapshot()
+        operations = snapshot['operations']
+        self.assertEqual(2, operations['insert']['calls'])
+        self.assertEqual(9, operations['insert']['nodes_visited'])
+        self.assertEqual(2, operations['search']['calls'])
+        self.assertEqual(7, operations['search']['nodes_visited'])
+        self.assertEqual(4, operations['longest_prefix']['nodes_visited'])
+        self.assertEqual(5, operations['delete']['nodes_visited'])
+        self.assertEqual(6, snapshot['nodes_allocated'])
+        self.assertEqual(2, snapshot['nodes_freed'])
+        self.assertEqual(2, sum(operations['search']['latency_ns'].values()))
+        json.dumps(snapshot)
+
+    def test_delete_shared_prefix(self):
+        trie = Trie()
+        stats = instrument(trie)
+        trie.insert('do')
+        trie.insert('dog')
+        trie.delete('do')
+        self.assertEqual(3, stats.nodes_allocated)
+        self.assertEqual(0, stats.nodes_freed)
+        trie.delete('dog')
+        self.assertEqual(3, stats.nodes_freed)
+        self.assertFalse(trie.root.has_children())
+
+    def test_bulk_insert(self):
+        trie = Trie()
+        trie.insert('dog')
+        stats = instrument(trie)
+        trie.bulk_insert(iter(['do', 'dog', 'dove', 'cat']), pause_gc=True)
+        self.assertTrue(trie.search('dove'))
+
+        snapshot = stats.snapshot()
+        self.assertEqual(1, snapshot['operations']['bulk_insert']['calls'])
+        self.assertEqual(12, snapshot['operations']['bulk_insert']['nodes_visited'])
+        self.assertEqual(1, sum(snapshot['operations']['bulk_insert']['latency_ns'].values()))
+        self.assertEqual(5, snapshot['nodes_allocated'])
+
+    def test_snapshot_trie_insert_counted_once(self):
+        trie = SnapshotTrie()
+        stats = instrument(trie)
+        trie.insert('cat')
+        trie.insert('car')
+        snapshot = stats.snapshot()
+        self.assertEqual(2, snapshot['operations']['insert']['calls'])
+        self.assertEqual(0, snapshot['operations']['bulk_insert']['calls'])
+        self.assertEqual(4, snapshot['nodes_allocated'])
+
+    def test_counts_after_reset(self):
+        trie = Trie()
+        stats = instrument(trie)
+        trie.insert('cat')
+        stats.reset()
+        trie.insert('car')
+        self.assertTrue(trie.search('car'))
+
+        snapshot = stats.snapshot()
+        self.assertEqual(1, snapshot['operations']['insert']['calls'])
+        self.assertEqual(1, snapshot['operations']['search']['calls'])
+        self.assertEqual(3, snapshot['operations']['search']['nodes_visited'])
+        self.assertEqual(1, sum(snapshot['operations']['insert']['latency_ns'].values()))
+        self.assertEqual(1, snapshot['nodes_allocated'])
+
+    def test_reset_and_detach(self):
+        trie = Trie()
+        stats = instrument(trie)
+        trie.insert('cat')
+        stats.reset()
+        self.assertEqual(0, stats.calls['insert'])
+        self.assertEqual(0, stats.nodes_allocated)
+
+        stats.detach()
+        self.assertNotIn('insert', vars(trie))
+        trie.insert('car')
+        self.assertTrue(trie.search('car'))
+        self.assertEqual(0, stats.calls['insert'])
+
+    def test_memory_stats(self):
+        trie = Trie()
+        trie.bulk_insert(['do', 'dog', 'cat'])
+        stats = memory_stats(trie)
+        self.assertEqual(7, stats['node_count'])
+        self.assertEqual(3, stats['max_depth'])
+        self.assertDictEqual({0: 1, 1: 2, 2: 2, 3: 2}, stats['depth_distribution'])
+        self.assertGreater(stats['estimated_bytes'], 0)
+        self.assertIn('memory', instrument(trie).snapshot(include_memory=True))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,22 @@
 from .trie import Trie, shortest_unique_prefix
+import gc
+import random
 import unittest
 
+def _levenshtein(a, b):
+    """Returns the edit distance between two strings."""
+    row = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j, y in enumerate(b, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (x != y))
+    return row[-1]
+
+def _dump(node):
+    """Returns a comparable snapshot of every node below the given one."""
+    return (node.character, node.count, node.is_terminal,
+        {character: _dump(child) for character, child in node.children.items()})
+
 class TestTrie(unittest.TestCase):
     def test_insert_search(self):
         trie = Trie()
@@ -63,6 +79,116 @@ class TestTrie(unittest.TestCase):
         self.assertTrue(trie.search('hello'))
         self.assertTrue(not trie.get_leaf('hello').has_children())
 
+    def test_delete_shared_branch(self):
+        trie = Trie()
+        trie.insert('hello')
+        trie.insert('help')
+        trie.delete('hello')
+        self.assertFalse(trie.search('hello'))
+        self.assertTrue(trie.search('help'))
+        self.assertEqual(1, trie.get_leaf('hel').count)
+
+    def test_delete_updates_counts(self):
+        trie = Trie()
+        trie.insert('dog')
+        trie.insert('dove')
+        trie.insert('dove')
+        trie.delete('dove')
+        self.assertFalse(trie.search('dove'))
+        self.assertEqual(1, trie.get_leaf('do').count)
+        self.assertIsNone(trie.get_leaf('dov'))
+        self.assertCountEqual(['d'], shortest_unique_prefix(trie))
+
+    def test_delete_missing(self):
+        trie = Trie()
+        trie.insert('hello')
+        trie.delete('help')
+        trie.delete('hell')
+        self.assertTrue(trie.search('hello'))
+        self.assertEqual(1, trie.get_leaf('hell').count)
+
+    def test_iter_prefix(self):
+        trie = Trie()
+        for word in ['help', 'hello', 'helloworld', 'world', 'he', 'hex']:
+            trie.insert(word)
+        self.assertListEqual(['he', 'hello', 'helloworld', 'help', 'hex'], list(trie.iter_prefix('he')))
+        self.assertListEqual(['hello', 'helloworld'], list(trie.iter_prefix('hello')))
+        self.assertListEqual(['he', 'hello'], list(trie.iter_prefix('', limit=2)))
+        self.assertListEqual([], list(trie.iter_prefix('foo')))
+
+        words = trie.iter_prefix('hel')
+        self.assertEqual('hello', next(words))
+        self.assertListEqual(['helloworld', 'help'], list(words))
+
+    def test_top_k(self):
+        trie = Trie()
+        for word, frequency in [('car', 3), ('cart', 5), ('care', 1), ('cat', 3), ('dog', 9)]:
+            for _ in range(frequency):
+                trie.insert(word)
+        self.assertListEqual([('cart', 5), ('car', 3), ('cat', 3)], trie.top_k('ca', 3))
+        self.assertListEqual([('dog', 9), ('cart', 5)], trie.top_k('', 2))
+        self.assertListEqual([('care', 1)], trie.top_k('care', 5))
+        self.assertListEqual([], trie.top_k('x', 5))
+
+        trie.delete('cart')
+        self.assertListEqual([('car', 3), ('cat', 3), ('care', 1)], trie.top_k('ca', 5))
+
+    def test_top_k_after_writes(self):
+        rng = random.Random(0)
+        words = [''.join(rng.choices('abc', k=rng.randint(1, 4))) for _ in range(30)]
+        frequencies = {}
+        trie = Trie()
+        for _ in range(2000):
+            word = rng.choice(words)
+            action = rng.random()
+            if action < 0.5:
+                trie.insert(word)
+                frequencies[word] = frequencies.get(word, 0) + 1
+            elif action < 0.6:
+                trie.delete(word)
+                frequencies.pop(word, None)
+            else:
+                prefix = word[:rng.randint(0, len(word))]
+                k = rng.randint(1, 6)
+                expected = sorted(((word, frequency) for word, frequency in frequencies.items()
+                    if word.startswith(prefix)), key=lambda result: (-result[1], result[0]))[:k]
+                self.assertListEqual(expected, trie.top_k(prefix, k))
+
+    def test_top_k_only_rebuilds_changed_paths(self):
+        trie = Trie()
+        for word in ['apple', 'apply', 'banana', 'band']:
+            trie.insert(word)
+        self.assertListEqual([('apple', 1), ('apply', 1)], trie.top_k('', 2))
+        banana = trie.get_leaf('b').top_words
+        trie.insert('apply')
+        self.assertIsNone(trie.get_leaf('app').top_words)
+        self.assertIs(banana, trie.get_leaf('b').top_words)
+        self.assertListEqual([('apply', 2), ('apple', 1)], trie.top_k('', 2))
+
+    def test_search_fuzzy(self):
+        trie = Trie()
+        for word in ['hello', 'help', 'hell', 'yellow', 'world', 'he']:
+            trie.insert(word)
+        self.assertListEqual([('hello', 0), ('hell', 1)], trie.search_fuzzy('hello', 1))
+        self.assertListEqual([('hell', 1), ('hello', 1), ('help', 1)], trie.search_fuzzy('helo', 1))
+        self.assertListEqual(
+            [('hell', 1), ('hello', 1), ('help', 1), ('he', 2)], trie.search_fuzzy('helo', 2))
+        self.assertListEqual([('world', 1)], trie.search_fuzzy('wrld', 1))
+        self.assertListEqual([], trie.search_fuzzy('xyz', 1))
+
+    def test_search_fuzzy_matches_brute_force(self):
+        rng = random.Random(0)
+        words = {''.join(rng.choices('abc', k=rng.randint(0, 6))) for _ in range(100)}
+        trie = Trie()
+        trie.bulk_insert(words)
+        for query in ['', 'a', 'abc', 'cabba', 'aaaaaaa']:
+            for max_distance in range(3):
+                expected = sorted(
+                    ((word, _levenshtein(query, word)) for word in words
+                        if _levenshtein(query, word) <= max_distance),
+                    key=lambda result: (result[1], result[0]))
+                self.assertListEqual(expected, trie.search_fuzzy(query, max_distance))
+
     def test_longest_prefix(self):
         trie = Trie()
         trie.insert('hello')
@@ -71,6 +197,75 @@ class TestTrie(unittest.TestCase):
         self.assertEqual('helloworld', trie.longest_prefix('helloworldandallwhoinhabitit'))
         self.assertIsNone(trie.longest_prefix('foobar'))
 
+    def test_long_keys(self):
+        long_word = 'ab' * 2500
+        trie = Trie()
+        trie.insert(long_word)
+        trie.insert(long_word[:3000])
+        self.assertTrue(trie.search(long_word))
+        self.assertFalse(trie.search(long_word[:-1]))
+        self.assertEqual(long_word[:3000], trie.longest_prefix(long_word[:4000]))
+        self.assertEqual(long_word, trie.longest_prefix(long_word + 'c'))
+        self.assertCountEqual([long_word[:3001]], shortest_unique_prefix(trie))
+
+        trie.delete(long_word[:3000])
+        self.assertFalse(trie.search(long_word[:3000]))
+        self.assertTrue(trie.search(long_word))
+        trie.delete(long_word)
+        self.assertFalse(trie.root.has_children())
+
+    def test_bulk_insert_matches_insert(self):
+        words = ['dog', 'dove', 'duck', 'duck', 'hello', 'helloworld', 'zebra', '']
+        for ordered in (sorted(words), words):
+            expected = Trie()
+            for word in ordered:
+                expected.insert(word)
+
+            trie = Trie()
+            trie.bulk_insert(word for word in ordered)
+            self.assertEqual(_dump(expected.root), _dump(trie.root))
+
+    def test_bulk_insert_into_existing(self):
+        expected = Trie()
+        trie = Trie()
+        for word in ['help', 'hello']:
+            expected.insert(word)
+            trie.insert(word)
+        for word in ['hel', 'helloworld', 'world']:
+            expected.insert(word)
+        trie.bulk_insert(['hel', 'helloworld', 'world'])
+        self.assertEqual(_dump(expected.root), _dump(trie.root))
+
+    def test_bulk_insert_iterable_raises(self):
+        def words():
+            yield 'apple'
+            yield 'apply'
+            raise OSError('read failed')
+
+        trie = Trie()
+        with self.assertRaises(OSError):
+            trie.bulk_insert(words())
+        expected = Trie()
+        expected.insert('apple')
+        expected.insert('apply')
+        self.assertEqual(_dump(expected.root), _dump(trie.root))
+        self.assertEqual(2, trie.get_leaf('a').count)
+        self.assertListEqual(['apple', 'apply'], shortest_unique_prefix(trie))
+
+    def test_bulk_insert_pause_gc(self):
+        trie = Trie()
+        trie.bulk_insert(['dog', 'dove'], pause_gc=True)
+        self.assertTrue(gc.isenabled())
+        self.assertTrue(trie.search('dove'))
+
+    def test_from_sorted(self):
+        trie = Trie.from_sorted(iter(['hello', 'helloworld', 'world']))
+        self.assertTrue(trie.search('hello'))
+        self.assertTrue(trie.search('helloworld'))
+        self.assertTrue(trie.search('world'))
+        self.assertFalse(trie.search('hell'))
+        self.assertEqual(2, trie.get_leaf('hello').count)
+
 class TestTrieFunctions(unittest.TestCase):
     def test_shortest_unique_prefix(self):
         trie = Trie()
@@ -81,5 +276,17 @@ class TestTrieFunctions(unittest.TestCase):
         prefixes = shortest_unique_prefix(trie)
         self.assertCountEqual(['dog', 'dov', 'du', 'z'], prefixes)
 
+    def test_shortest_unique_prefix_order(self):
+        trie = Trie()
+        for word in ['zebra', 'dog', 'duck', 'dove', 'zoo']:
+            trie.insert(word)
+        self.assertListEqual(['ze', 'zo', 'dog', 'dov', 'du'], shortest_unique_prefix(trie))
+
+    def test_shortest_unique_prefix_long_keys(self):
+        trie = Trie()
+        trie.insert('x' * 5000 + 'a')
+        trie.insert('x' * 5000 + 'b')
+        self.assertListEqual(['x' * 5000 + 'a', 'x' * 5000 + 'b'], shortest_unique_prefix(trie))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file